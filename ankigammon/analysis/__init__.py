@@ -1,6 +1,7 @@
 """Analysis module for AnkiGammon."""
 
 from ankigammon.analysis.score_matrix import (
+    ScoreMatrix,
     ScoreMatrixCell,
     generate_score_matrix,
     format_matrix_as_html
@@ -13,6 +14,7 @@ from ankigammon.analysis.move_score_matrix import (
 )
 
 __all__ = [
+    'ScoreMatrix',
     'ScoreMatrixCell',
     'generate_score_matrix',
     'format_matrix_as_html',
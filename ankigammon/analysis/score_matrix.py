@@ -6,12 +6,33 @@ in a match (e.g., 2a-2a through 7a-7a for a 7-point match).
 """
 
 import logging
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+from ankigammon.utils.analyzer_base import BackgammonAnalyzer
 
 logger = logging.getLogger(__name__)
 
 
+# Which two of (ND, D/T, D/P) errors a cell displays, by best action
+_DISPLAYED_ERROR_INDICES = {
+    "N/T": (1, 2),
+    "TG/T": (1, 2),
+    "TG/P": (1, 2),
+    "D/T": (0, 2),
+    "D/P": (0, 1),
+}
+
+# CSS class for each simplified cube action shown in the matrix
+_ACTION_CSS_CLASSES = {
+    "D/T": "action-double-take",
+    "D/P": "action-double-pass",
+    "N/T": "action-no-double",
+    "TG/T": "action-too-good",
+    "TG/P": "action-too-good",
+}
+
+
 @dataclass
 class ScoreMatrixCell:
     """Represents one cell in the score matrix."""
@@ -23,6 +44,29 @@ class ScoreMatrixCell:
     error_double: Optional[float]  # Error if double/take
     error_pass: Optional[float]  # Error if pass
 
+    # Displayed errors (scaled by 1000) and their formatted text, derived once
+    _displayed: Tuple[int, int] = field(init=False, repr=False, compare=False)
+    _display_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        errors = (self.error_no_double, self.error_double, self.error_pass)
+        indices = _DISPLAYED_ERROR_INDICES.get(self.best_action.upper())
+
+        if indices is None:
+            # Fallback: use ND and DT
+            shown = errors[:2]
+            no_alternatives = all(e is None for e in errors)
+        else:
+            shown = (errors[indices[0]], errors[indices[1]])
+            no_alternatives = shown[0] is None and shown[1] is None
+
+        self._displayed = tuple(
+            int(round(e * 1000)) if e is not None else 0 for e in shown
+        )
+        self._display_str = (
+            "—" if no_alternatives else f"{self._displayed[0]}/{self._displayed[1]}"
+        )
+
     def format_errors(self) -> str:
         """
         Format error values for display in matrix.
@@ -36,35 +80,7 @@ class ScoreMatrixCell:
         Returns:
             String like "24/543" (errors scaled by 1000), or "—" if no alternatives exist
         """
-        if self.error_no_double is None and self.error_double is None and self.error_pass is None:
-            return "—"
-
-        def scale_error(error: Optional[float]) -> int:
-            return int(round(error * 1000)) if error is not None else 0
-
-        nd_error = scale_error(self.error_no_double)
-        dt_error = scale_error(self.error_double)
-        dp_error = scale_error(self.error_pass)
-
-        best_action_upper = self.best_action.upper()
-
-        if best_action_upper in ["N/T", "TG/T", "TG/P"]:
-            displayed_errors = [dt_error, dp_error]
-        elif best_action_upper == "D/T":
-            displayed_errors = [nd_error, dp_error]
-        elif best_action_upper == "D/P":
-            displayed_errors = [nd_error, dt_error]
-        else:
-            displayed_errors = [nd_error, dt_error]
-
-        if self.error_double is None and self.error_pass is None and best_action_upper in ["N/T", "TG/T", "TG/P"]:
-            return "—"
-        if self.error_no_double is None and self.error_pass is None and best_action_upper == "D/T":
-            return "—"
-        if self.error_no_double is None and self.error_double is None and best_action_upper == "D/P":
-            return "—"
-
-        return f"{displayed_errors[0]}/{displayed_errors[1]}"
+        return self._display_str
 
     def has_low_errors(self, threshold: int = 20) -> bool:
         """
@@ -80,33 +96,39 @@ class ScoreMatrixCell:
         Returns:
             True if minimum of displayed errors is below threshold (close decision)
         """
-        # Helper to scale error
-        def scale_error(error: Optional[float]) -> int:
-            return int(round(error * 1000)) if error is not None else 0
-
-        # Get all three errors
-        nd_error = scale_error(self.error_no_double)
-        dt_error = scale_error(self.error_double)
-        dp_error = scale_error(self.error_pass)
-
-        # Determine which two errors are displayed based on best action
-        best_action_upper = self.best_action.upper()
-
-        if best_action_upper in ["N/T", "TG/T", "TG/P"]:
-            # Display DT and DP errors
-            displayed_errors = [dt_error, dp_error]
-        elif best_action_upper == "D/T":
-            # Display ND and DP errors
-            displayed_errors = [nd_error, dp_error]
-        elif best_action_upper == "D/P":
-            # Display ND and DT errors
-            displayed_errors = [nd_error, dt_error]
-        else:
-            # Fallback: use ND and DT
-            displayed_errors = [nd_error, dt_error]
+        return min(self._displayed) < threshold
+
+
+@dataclass
+class ScoreMatrix:
+    """
+    Square score matrix stored as one flat, row-major list of cells.
+
+    Indexing and iterating yield rows (``matrix[row][col]``), so callers
+    written against a nested list keep working.
+    """
+
+    cells: List[ScoreMatrixCell]
+    size: int
 
-        # Check if minimum of displayed errors is below threshold
-        return min(displayed_errors) < threshold
+    def cell(self, row: int, col: int) -> ScoreMatrixCell:
+        """Return the cell at [row][col] without building a row list."""
+        return self.cells[row * self.size + col]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, row: int) -> List[ScoreMatrixCell]:
+        if row < 0:
+            row += self.size
+        if not 0 <= row < self.size:
+            raise IndexError("score matrix row out of range")
+        start = row * self.size
+        return self.cells[start:start + self.size]
+
+    def __iter__(self) -> Iterator[List[ScoreMatrixCell]]:
+        for start in range(0, self.size * self.size, self.size):
+            yield self.cells[start:start + self.size]
 
 
 def resolve_effective_match_length(match_length: int, max_size: int) -> int:
@@ -130,7 +152,7 @@ def resolve_effective_match_length(match_length: int, max_size: int) -> int:
 def generate_score_matrix(
     xgid: str,
     match_length: int,
-    analyzer: 'BackgammonAnalyzer',
+    analyzer: BackgammonAnalyzer,
     progress_callback: Optional[callable] = None,
     cancellation_callback: Optional[callable] = None,
     use_parallel: bool = True,
@@ -139,7 +161,7 @@ def generate_score_matrix(
     # Legacy parameters for backward compatibility
     gnubg_path: Optional[str] = None,
     ply_level: int = 3,
-) -> List[List[ScoreMatrixCell]]:
+) -> ScoreMatrix:
     """
     Generate a score matrix for all RELEVANT score combinations in a match.
 
@@ -160,14 +182,15 @@ def generate_score_matrix(
         analyzer: BackgammonAnalyzer instance to use for analysis
         progress_callback: Optional callback(message: str) for progress updates
         cancellation_callback: Optional callback() that returns True if cancelled
-        use_parallel: Use parallel analysis (default: True, ~5-9x faster)
+        use_parallel: Analyze all cells in one batched engine session, falling
+            back to parallel workers (default: True)
         cube_value: Current cube value before doubling (default: 1)
         cube_owner: Current cube owner (default: extracted from XGID)
         gnubg_path: DEPRECATED - use analyzer parameter instead
         ply_level: DEPRECATED - use analyzer parameter instead
 
     Returns:
-        2D list of ScoreMatrixCell objects, indexed as [row][col]
+        ScoreMatrix of ScoreMatrixCell objects, indexed as [row][col]
         where row = player_away - min_away, col = opponent_away - min_away
 
     Raises:
@@ -178,7 +201,6 @@ def generate_score_matrix(
 
     from ankigammon.utils.xgid import parse_xgid, encode_xgid
     from ankigammon.models import Player, CubeState
-    from ankigammon.utils.analyzer_base import BackgammonAnalyzer
 
     # Legacy fallback: if analyzer not provided, create from gnubg_path
     if analyzer is None and gnubg_path is not None:
@@ -231,48 +253,69 @@ def generate_score_matrix(
     # Calculate total cells for progress
     total_cells = matrix_size * matrix_size
 
-    # Prepare all position IDs and coordinate mappings
-    position_ids = []
-    coord_list = []  # [(player_away, opponent_away), ...]
+    # Use actual cube state (supports both initial double and redoubles)
+    def encode_cell_xgid(score_x: int, score_o: int) -> str:
+        return encode_xgid(
+            position=position,
+            cube_value=cube_value,
+            cube_owner=cube_owner,
+            dice=None,
+            on_roll=on_roll,
+            score_x=score_x,
+            score_o=score_o,
+            match_length=match_length,
+            crawford_jacoby=synthetic_crawford_jacoby,
+            max_cube=metadata.get('max_cube', 256)
+        )
 
-    for player_away in range(min_away, match_length + 1):
-        for opponent_away in range(min_away, match_length + 1):
-            # Calculate actual scores from "away" values
-            score_on_roll = match_length - player_away
-            score_opponent = match_length - opponent_away
+    # Only the score fields differ between cells, so encode the position once
+    # and splice each cell's scores in (XGID field 5 = O's score, 6 = X's).
+    template_fields = encode_cell_xgid(0, 0).split(':')
+    xgid_prefix = ':'.join(template_fields[:5]) + ':'
+    xgid_suffix = ':' + ':'.join(template_fields[7:])
+    if f"{xgid_prefix}1:2{xgid_suffix}" != encode_cell_xgid(score_x=2, score_o=1):
+        # Unexpected layout: fall back to encoding every cell in full
+        xgid_prefix = None
+
+    # Prepare all coordinate mappings and position IDs in row-major order
+    away_range = range(min_away, match_length + 1)
+    coord_list = [(p_away, o_away) for p_away in away_range for o_away in away_range]
+
+    # Who is on roll is the same for every cell, so resolve it once
+    o_on_roll = on_roll == Player.O
+
+    def cell_xgid(player_away: int, opponent_away: int) -> str:
+        # Calculate actual scores from "away" values
+        score_on_roll = match_length - player_away
+        score_opponent = match_length - opponent_away
+
+        # Map scores to X and O based on who's on roll
+        score_x, score_o = (
+            (score_opponent, score_on_roll) if o_on_roll else (score_on_roll, score_opponent)
+        )
 
-            # Map scores to X and O based on who's on roll
-            if on_roll == Player.O:
-                score_o = score_on_roll
-                score_x = score_opponent
-            else:
-                score_x = score_on_roll
-                score_o = score_opponent
-
-            # Use actual cube state (supports both initial double and redoubles)
-            modified_xgid = encode_xgid(
-                position=position,
-                cube_value=cube_value,
-                cube_owner=cube_owner,
-                dice=None,
-                on_roll=on_roll,
-                score_x=score_x,
-                score_o=score_o,
-                match_length=match_length,
-                crawford_jacoby=synthetic_crawford_jacoby,
-                max_cube=metadata.get('max_cube', 256)
-            )
+        if xgid_prefix is not None:
+            return f"{xgid_prefix}{score_o}:{score_x}{xgid_suffix}"
+        return encode_cell_xgid(score_x, score_o)
+
+    position_ids = [cell_xgid(p_away, o_away) for p_away, o_away in coord_list]
 
-            position_ids.append(modified_xgid)
-            coord_list.append((player_away, opponent_away))
+    # Cells that map to the same XGID only need to be analyzed once.
+    # Keep the first cell's coordinates for each unique XGID for progress text.
+    first_coord = {}
+    for pos_id, coord in zip(position_ids, coord_list):
+        first_coord.setdefault(pos_id, coord)
+    unique_ids = list(first_coord)
+    unique_coords = list(first_coord.values())
+    unique_index = {pos_id: i for i, pos_id in enumerate(unique_ids)}
 
     logger.info(
-        "Score matrix: %dx%d (%d cells), cube=%d, min_away=%d",
-        matrix_size, matrix_size, total_cells, cube_value, min_away
+        "Score matrix: %dx%d (%d cells, %d unique), cube=%d, min_away=%d",
+        matrix_size, matrix_size, total_cells, len(unique_ids), cube_value, min_away
     )
 
-    # Analyze all positions (parallel or sequential)
-    if use_parallel and len(position_ids) > 2:
+    # Analyze all positions (batched or sequential)
+    if use_parallel and len(unique_ids) > 2:
         # Parallel analysis with progress tracking
         def parallel_progress_callback(completed: int, total: int):
             # Check for cancellation
@@ -280,110 +323,152 @@ def generate_score_matrix(
                 raise InterruptedError("Score matrix generation cancelled by user")
 
             if completed < total:
-                p_away, o_away = coord_list[completed]
+                p_away, o_away = unique_coords[completed]
                 logger.debug(
                     "Score matrix: analyzing cell %da-%da (%d/%d)",
                     p_away, o_away, completed + 1, total
                 )
             if progress_callback and completed < total:
-                p_away, o_away = coord_list[completed]
+                p_away, o_away = unique_coords[completed]
                 progress_callback(
                     f"Analyzing score {p_away}a-{o_away}a ({completed + 1}/{total})..."
                 )
 
-        analysis_results = analyzer.analyze_positions_parallel(
-            position_ids,
-            progress_callback=parallel_progress_callback,
-            cancellation_callback=cancellation_callback
-        )
+        # One engine session for every cell amortizes process startup and
+        # weight loading; fall back to per-position workers if it fails.
+        try:
+            analysis_results = analyzer.analyze_positions_batch(
+                unique_ids,
+                progress_callback=parallel_progress_callback,
+                cancellation_callback=cancellation_callback
+            )
+        except RuntimeError as e:
+            logger.warning("Batched score matrix analysis failed, falling back to parallel: %s", e)
+            analysis_results = analyzer.analyze_positions_parallel(
+                unique_ids,
+                progress_callback=parallel_progress_callback,
+                cancellation_callback=cancellation_callback
+            )
     else:
         # Sequential analysis (fallback for small matrices or if disabled)
         analysis_results = []
-        for idx, pos_id in enumerate(position_ids):
+        total_unique = len(unique_ids)
+        for idx, pos_id in enumerate(unique_ids):
             # Check for cancellation
             if cancellation_callback and cancellation_callback():
                 raise InterruptedError("Score matrix generation cancelled by user")
 
-            p_away, o_away = coord_list[idx]
+            p_away, o_away = unique_coords[idx]
             logger.debug(
                 "Score matrix: analyzing cell %da-%da (%d/%d)",
-                p_away, o_away, idx + 1, total_cells
+                p_away, o_away, idx + 1, total_unique
             )
             if progress_callback:
                 progress_callback(
-                    f"Analyzing score {p_away}a-{o_away}a ({idx + 1}/{total_cells})..."
+                    f"Analyzing score {p_away}a-{o_away}a ({idx + 1}/{total_unique})..."
                 )
             analysis_results.append(analyzer.analyze_position(pos_id))
 
-    # Process results and build matrix
-    matrix = []
-    result_idx = 0
+    # Process results and build matrix. Parsing is pure on the output text,
+    # so cells whose engine output is identical share one parse.
+    parsed_outputs = {}
+
+    def parse_cube_decision(output: str) -> list:
+        moves = parsed_outputs.get(output)
+        if moves is None:
+            moves = parsed_outputs[output] = analyzer.parse_cube_decision(output)
+        return moves
+
+    cells = [
+        _build_cell(
+            analysis_results[unique_index[pos_id]][0],
+            parse_cube_decision,
+            player_away,
+            opponent_away,
+        )
+        for pos_id, (player_away, opponent_away) in zip(position_ids, coord_list)
+    ]
+    matrix = ScoreMatrix(cells, matrix_size)
 
-    for player_away in range(min_away, match_length + 1):
-        row = []
-        for opponent_away in range(min_away, match_length + 1):
-            # Get analysis result
-            output, decision_type = analysis_results[result_idx]
-            result_idx += 1
+    logger.info("Score matrix complete: %dx%d (%d cells)", matrix_size, matrix_size, total_cells)
+    return matrix
 
-            # Parse cube decision
-            moves = analyzer.parse_cube_decision(output)
 
-            if not moves:
-                raise ValueError(
-                    f"Could not parse cube decision at score {player_away}a-{opponent_away}a"
-                )
+def _build_cell(
+    output: str,
+    parse_cube_decision: Callable[[str], list],
+    player_away: int,
+    opponent_away: int,
+) -> ScoreMatrixCell:
+    """
+    Turn one cell's raw engine output into a ScoreMatrixCell.
 
-            # Build equity map
-            equity_map = {m.notation: m.equity for m in moves}
+    Args:
+        output: Raw cube analysis text for the cell's XGID
+        parse_cube_decision: Analyzer's cube-decision parser
+        player_away: Player on roll's score (away from match)
+        opponent_away: Opponent's score (away from match)
 
-            # Find best move
-            best_move = next((m for m in moves if m.rank == 1), None)
-            if not best_move:
-                raise ValueError(
-                    f"Could not determine best cube action at score {player_away}a-{opponent_away}a"
-                )
+    Returns:
+        ScoreMatrixCell with the best action and errors of the alternatives
 
-            # Get equities for the 3 main actions
-            no_double_eq = equity_map.get("No Double/Take", None)
-            double_take_eq = equity_map.get("Double/Take", equity_map.get("Redouble/Take", None))
-            double_pass_eq = equity_map.get("Double/Pass", equity_map.get("Redouble/Pass", None))
-
-            # Simplify best action notation
-            best_action_simplified = BackgammonAnalyzer.simplify_cube_notation(best_move.notation)
-
-            # Calculate errors for wrong decisions
-            best_equity = best_move.equity
-            error_no_double = None
-            error_double = None
-            error_pass = None
-
-            if no_double_eq is not None:
-                error_no_double = abs(best_equity - no_double_eq) if best_action_simplified != "N/T" else 0.0
-            if double_take_eq is not None:
-                error_double = abs(best_equity - double_take_eq) if best_action_simplified not in ["D/T", "TG/T"] else 0.0
-            if double_pass_eq is not None:
-                error_pass = abs(best_equity - double_pass_eq) if best_action_simplified != "D/P" else 0.0
-
-            # Create cell
-            cell = ScoreMatrixCell(
-                player_away=player_away,
-                opponent_away=opponent_away,
-                best_action=best_action_simplified,
-                error_no_double=error_no_double,
-                error_double=error_double,
-                error_pass=error_pass
-            )
-            row.append(cell)
+    Raises:
+        ValueError: If the output has no parseable cube decision
+    """
+    moves = parse_cube_decision(output)
 
-        matrix.append(row)
+    if not moves:
+        raise ValueError(
+            f"Could not parse cube decision at score {player_away}a-{opponent_away}a"
+        )
 
-    logger.info("Score matrix complete: %dx%d (%d cells)", matrix_size, matrix_size, total_cells)
-    return matrix
+    # Build equity map
+    equity_map = {m.notation: m.equity for m in moves}
+
+    # Find best move
+    best_move = next((m for m in moves if m.rank == 1), None)
+    if not best_move:
+        raise ValueError(
+            f"Could not determine best cube action at score {player_away}a-{opponent_away}a"
+        )
+
+    # Get equities for the 3 main actions
+    no_double_eq = equity_map.get("No Double/Take", None)
+    double_take_eq = equity_map.get("Double/Take", equity_map.get("Redouble/Take", None))
+    double_pass_eq = equity_map.get("Double/Pass", equity_map.get("Redouble/Pass", None))
+
+    # Simplify best action notation
+    best_action_simplified = BackgammonAnalyzer.simplify_cube_notation(best_move.notation)
+
+    # Calculate errors for wrong decisions. abs() is required: the
+    # proper action accounts for the opponent's best response, so an
+    # alternative can carry a higher raw equity than the best action
+    # (e.g. D/P at +1.000 when No Double is correct, or D/T above D/P
+    # when the correct response is a pass).
+    best_equity = best_move.equity
+    error_no_double = None
+    error_double = None
+    error_pass = None
+
+    if no_double_eq is not None:
+        error_no_double = abs(best_equity - no_double_eq) if best_action_simplified != "N/T" else 0.0
+    if double_take_eq is not None:
+        error_double = abs(best_equity - double_take_eq) if best_action_simplified not in ["D/T", "TG/T"] else 0.0
+    if double_pass_eq is not None:
+        error_pass = abs(best_equity - double_pass_eq) if best_action_simplified != "D/P" else 0.0
+
+    return ScoreMatrixCell(
+        player_away=player_away,
+        opponent_away=opponent_away,
+        best_action=best_action_simplified,
+        error_no_double=error_no_double,
+        error_double=error_double,
+        error_pass=error_pass
+    )
 
 
 def format_matrix_as_html(
-    matrix: List[List[ScoreMatrixCell]],
+    matrix: Union[ScoreMatrix, List[List[ScoreMatrixCell]]],
     current_player_away: Optional[int] = None,
     current_opponent_away: Optional[int] = None,
     ply_level: Optional[int] = None,
@@ -422,7 +507,7 @@ def format_matrix_as_html(
     min_away = matrix[0][0].player_away if matrix and matrix[0] else cube_value + 1
 
     # Start table
-    html = '<div class="score-matrix">\n'
+    parts: List[str] = ['<div class="score-matrix">\n']
 
     # Build title based on cube state
     if cube_owner == CubeState.CENTERED or cube_owner is None:
@@ -434,21 +519,21 @@ def format_matrix_as_html(
     label = analysis_label or (f"{ply_level}-ply" if ply_level is not None else None)
     if label:
         title += f' <span class="ply-indicator">({label})</span>'
-    html += f'<h3>{title}</h3>\n'
+    parts.append(f'<h3>{title}</h3>\n')
 
-    html += '<table class="score-matrix-table">\n'
+    parts.append('<table class="score-matrix-table">\n')
 
     # Header row
-    html += '<tr><th></th>'
+    parts.append('<tr><th></th>')
     for col in range(matrix_size):
         away = col + min_away
-        html += f'<th>{away}a</th>'
-    html += '</tr>\n'
+        parts.append(f'<th>{away}a</th>')
+    parts.append('</tr>\n')
 
     # Data rows
     for row_idx, row in enumerate(matrix):
         player_away = row_idx + min_away
-        html += f'<tr><th>{player_away}a</th>'
+        parts.append(f'<tr><th>{player_away}a</th>')
 
         for col_idx, cell in enumerate(row):
             opponent_away = col_idx + min_away
@@ -458,35 +543,36 @@ def format_matrix_as_html(
                 current_player_away == player_away and
                 current_opponent_away == opponent_away
             )
-
-            action_class = _get_action_css_class(cell.best_action)
             current_class = " current-score" if is_current else ""
-            low_error_class = " low-error" if cell.has_low_errors() else ""
             formatted_errors = cell.format_errors()
 
             # Show only em dash when no alternatives available
             if formatted_errors == "—":
-                html += f'<td class="action-no-alternatives{current_class}">'
-                html += f'<div class="action">—</div>'
-                html += '</td>'
+                parts.append(
+                    f'<td class="action-no-alternatives{current_class}">'
+                    f'<div class="action">—</div></td>'
+                )
             else:
-                html += f'<td class="{action_class}{current_class}{low_error_class}">'
-                html += f'<div class="action">{cell.best_action}</div>'
-                html += f'<div class="errors">{formatted_errors}</div>'
-                html += '</td>'
+                action_class = _get_action_css_class(cell.best_action)
+                low_error_class = " low-error" if cell.has_low_errors() else ""
+                parts.append(
+                    f'<td class="{action_class}{current_class}{low_error_class}">'
+                    f'<div class="action">{cell.best_action}</div>'
+                    f'<div class="errors">{formatted_errors}</div></td>'
+                )
 
-        html += '</tr>\n'
+        parts.append('</tr>\n')
 
-    html += '</table>\n'
+    parts.append('</table>\n')
     if caption:
-        html += (
+        parts.append(
             f'<p class="matrix-caption" '
             f'style="font-size: 12px; color: #a6adc8; margin: 6px 0 0;">'
             f'{caption}</p>\n'
         )
-    html += '</div>\n'
+    parts.append('</div>\n')
 
-    return html
+    return ''.join(parts)
 
 
 def _get_action_css_class(action: str) -> str:
@@ -499,15 +585,4 @@ def _get_action_css_class(action: str) -> str:
     Returns:
         CSS class name
     """
-    action_upper = action.upper()
-
-    if action_upper == "D/T":
-        return "action-double-take"
-    elif action_upper == "D/P":
-        return "action-double-pass"
-    elif action_upper == "N/T":
-        return "action-no-double"
-    elif action_upper.startswith("TG"):
-        return "action-too-good"
-    else:
-        return "action-unknown"
+    return _ACTION_CSS_CLASSES.get(action.upper(), "action-unknown")
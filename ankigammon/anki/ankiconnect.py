@@ -1,9 +1,37 @@
 """Anki-Connect integration for direct note creation in Anki."""
 
-import requests
-from typing import Any, List, Optional, Tuple
+import http.client
+import select
+import socket
+from typing import Any, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
 
-from ankigammon.anki.card_styles import MODEL_NAME, CARD_CSS
+from ankigammon.anki.card_styles import MODEL_NAME, get_card_css
+
+# Note payloads embed full SVG boards, so JSON encoding is a real cost on
+# large exports. Use orjson when it is installed; stdlib json otherwise.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Notes per addNotes request. Each note carries full SVG boards, and
+# Anki-Connect handles requests on Anki's main thread, so oversized
+# batches stall Anki and risk the request timeout.
+DEFAULT_BATCH_SIZE = 64
+
+# Errors meaning a kept-alive socket was closed by the server between calls
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
 
 # Historic note-type names. AnkiConnect has no rename action, so when
 # MODEL_NAME changes (commit 6a61037 renamed "XG Backgammon Decision" ->
@@ -13,6 +41,18 @@ from ankigammon.anki.card_styles import MODEL_NAME, CARD_CSS
 LEGACY_MODEL_NAMES: Tuple[str, ...] = ("XG Backgammon Decision",)
 
 
+def _connection_dropped(conn: http.client.HTTPConnection) -> bool:
+    """Whether the server has closed an idle kept-alive connection."""
+    sock = conn.sock
+    if not isinstance(sock, socket.socket):
+        return False  # Not connected yet; http.client connects on request
+    try:
+        # An idle socket only becomes readable once the server closes it
+        return bool(select.select([sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
 class AnkiConnect:
     """
     Interface to Anki via Anki-Connect addon.
@@ -21,20 +61,100 @@ class AnkiConnect:
     https://ankiweb.net/shared/info/2055492159
     """
 
-    def __init__(self, url: str = "http://localhost:8765", deck_name: str = "My AnkiGammon Deck"):
+    def __init__(
+        self,
+        url: str = "http://localhost:8765",
+        deck_name: str = "My AnkiGammon Deck",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
         """
         Initialize Anki-Connect client.
 
         Args:
             url: Anki-Connect API URL
             deck_name: Target deck name
+            batch_size: Maximum notes sent per addNotes request or upsert batch
         """
         self.url = url
         self.deck_name = deck_name
+        self.batch_size = max(1, batch_size)
         # The model new notes should be added to. Resolved by create_model()
         # to the legacy name if a user is carrying pre-rename notes and has
         # no current-named model yet, so we don't fork their collection.
         self._active_model_name: str = MODEL_NAME
+        # Set up once per client: create_model() and create_deck() skip
+        # their Anki-Connect round-trips after the first successful call.
+        self._model_ready: bool = False
+        self._created_decks: Set[str] = set()
+
+        # Anki-Connect is a local plain-HTTP endpoint, so a single
+        # keep-alive http.client connection is all we need.
+        parts = urlsplit(url)
+        self._host = parts.hostname or 'localhost'
+        self._port = parts.port
+        self._path = parts.path or '/'
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        )
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> 'AnkiConnect':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _post(self, body: bytes) -> bytes:
+        """
+        POST a JSON body to Anki-Connect over the kept-alive connection.
+
+        A kept-alive socket the server has since closed is replaced before
+        the request is written. The request is only re-sent if writing it to
+        a reused socket fails; once it has been sent, a failure while reading
+        the response is raised instead, as Anki may already have run the
+        action (re-sending addNotes would add the notes twice).
+
+        Args:
+            body: Encoded JSON request body
+
+        Returns:
+            Raw response body
+
+        Raises:
+            OSError: If the connection fails or times out
+            http.client.HTTPException: On an HTTP-level error
+        """
+        if self._conn is not None and _connection_dropped(self._conn):
+            self.close()
+        reused = self._conn is not None
+        if self._conn is None:
+            self._conn = self._connection_class(self._host, self._port, timeout=5)
+
+        try:
+            self._conn.request('POST', self._path, body=body, headers=_JSON_HEADERS)
+        except _STALE_CONNECTION_ERRORS:
+            self.close()
+            if not reused:
+                raise
+            self._conn = self._connection_class(self._host, self._port, timeout=5)
+            self._conn.request('POST', self._path, body=body, headers=_JSON_HEADERS)
+
+        try:
+            response = self._conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            self.close()
+            raise
+
+        content = response.read()
+        if response.status >= 400:
+            raise http.client.HTTPException(f"{response.status} {response.reason}")
+        return content
 
     def invoke(self, action: str, **params) -> Any:
         """
@@ -57,29 +177,56 @@ class AnkiConnect:
         }
 
         try:
-            response = requests.post(self.url, json=payload, timeout=5)
-            response.raise_for_status()
-            result = response.json()
-
-            if 'error' in result and result['error']:
-                raise Exception(f"Anki-Connect error: {result['error']}")
-
-            return result.get('result')
-
-        except requests.exceptions.ConnectionError as e:
+            result = _json_loads(self._post(_json_dumps(payload)))
+        except socket.timeout:
+            self.close()
+            raise Exception(
+                f"Connection to Anki-Connect at {self.url} timed out. "
+                "Make sure Anki is running and responsive."
+            )
+        except OSError as e:
+            self.close()
             raise Exception(
                 f"Could not connect to Anki-Connect at {self.url}. "
                 f"Make sure Anki is running and Anki-Connect addon is installed. "
                 f"Details: {str(e)}"
             )
-        except requests.exceptions.Timeout:
-            raise Exception(
-                f"Connection to Anki-Connect at {self.url} timed out. "
-                "Make sure Anki is running and responsive."
-            )
-        except requests.exceptions.RequestException as e:
+        except (http.client.HTTPException, ValueError) as e:
+            self.close()
             raise Exception(f"Request failed: {str(e)}")
 
+        if 'error' in result and result['error']:
+            raise Exception(f"Anki-Connect error: {result['error']}")
+
+        return result.get('result')
+
+    def multi(self, actions: List[Tuple[str, dict]]) -> List[Any]:
+        """
+        Run several Anki-Connect actions in one request.
+
+        Anki executes the actions in order, so later actions see the effects
+        of earlier ones.
+
+        Args:
+            actions: (action, params) pairs
+
+        Returns:
+            Action results in the same order as actions
+
+        Raises:
+            Exception: If the request fails or any action returns an error
+        """
+        if not actions:
+            return []
+        replies = self.invoke('multi', actions=[
+            {'action': action, 'version': 6, 'params': params}
+            for action, params in actions
+        ])
+        for (action, _), reply in zip(actions, replies):
+            if reply.get('error'):
+                raise Exception(f"Anki-Connect error in {action}: {reply['error']}")
+        return [reply.get('result') for reply in replies]
+
     def test_connection(self) -> bool:
         """
         Test connection to Anki-Connect.
@@ -130,7 +277,10 @@ class AnkiConnect:
         """
         if deck_name is None:
             deck_name = self.deck_name
+        if deck_name in self._created_decks:
+            return
         self.invoke('createDeck', deck=deck_name)
+        self._created_decks.add(deck_name)
 
     def create_model(self) -> None:
         """Create the AnkiGammon note type if it doesn't exist.
@@ -140,7 +290,13 @@ class AnkiConnect:
         the user's collection (carryover from a pre-rename install),
         adopt it instead of creating a fresh one alongside it — the
         rename then stays invisible.
+
+        Only the first call per client talks to Anki; later calls return
+        immediately.
         """
+        if self._model_ready:
+            return
+
         model_names = self.invoke('modelNames')
 
         active = MODEL_NAME if MODEL_NAME in model_names else next(
@@ -150,7 +306,12 @@ class AnkiConnect:
 
         if active is not None:
             self._active_model_name = active
-            self.invoke('updateModelStyling', model={'name': active, 'css': CARD_CSS})
+            # Only push the stylesheet when it changed; an update bumps the
+            # model's modification time, so every export would otherwise
+            # send the note type on the next sync
+            css = get_card_css()
+            if self.invoke('modelStyling', modelName=active).get('css') != css:
+                self.invoke('updateModelStyling', model={'name': active, 'css': css})
             # Migrate older models that are missing fields added in later versions
             field_names = self.invoke('modelFieldNames', modelName=active)
             if 'XGID' not in field_names:
@@ -164,13 +325,14 @@ class AnkiConnect:
                     fieldName='AnalysisData',
                     index=len(field_names),
                 )
+            self._model_ready = True
             return
 
         self._active_model_name = MODEL_NAME
         model = {
             'modelName': MODEL_NAME,
             'inOrderFields': ['XGID', 'Front', 'Back', 'AnalysisData'],
-            'css': CARD_CSS,
+            'css': get_card_css(),
             'cardTemplates': [
                 {
                     'Name': 'Card 1',
@@ -180,8 +342,9 @@ class AnkiConnect:
             ]
         }
         self.invoke('createModel', **model)
+        self._model_ready = True
 
-    def add_note(
+    def build_note(
         self,
         front: str,
         back: str,
@@ -189,9 +352,9 @@ class AnkiConnect:
         deck_name: str = None,
         xgid: str = '',
         analysis_data: str = ''
-    ) -> int:
+    ) -> dict:
         """
-        Add a note to Anki.
+        Build an Anki-Connect note dict for addNote/addNotes.
 
         Args:
             front: Front HTML with embedded SVG
@@ -202,12 +365,12 @@ class AnkiConnect:
             analysis_data: Serialized Decision JSON for cosmetic re-rendering
 
         Returns:
-            Note ID
+            Note dict in Anki-Connect format
         """
         if deck_name is None:
             deck_name = self.deck_name
 
-        note = {
+        return {
             'deckName': deck_name,
             'modelName': self._active_model_name,
             'fields': {
@@ -222,7 +385,49 @@ class AnkiConnect:
             }
         }
 
-        return self.invoke('addNote', note=note)
+    def add_notes(self, notes: List[dict]) -> List[Optional[int]]:
+        """
+        Add several notes to Anki, batch_size notes per request.
+
+        Args:
+            notes: Note dicts as built by build_note()
+
+        Returns:
+            Note IDs in the same order as notes (None for notes Anki rejected)
+        """
+        note_ids: List[Optional[int]] = []
+        for start in range(0, len(notes), self.batch_size):
+            note_ids.extend(self.invoke('addNotes', notes=notes[start:start + self.batch_size]))
+        return note_ids
+
+    def add_note(
+        self,
+        front: str,
+        back: str,
+        tags: List[str],
+        deck_name: str = None,
+        xgid: str = '',
+        analysis_data: str = ''
+    ) -> int:
+        """
+        Add a note to Anki.
+
+        Args:
+            front: Front HTML with embedded SVG
+            back: Back HTML with embedded SVG
+            tags: List of tags
+            deck_name: Target deck name. If None, uses self.deck_name.
+            xgid: XGID string for the position (used as sort field)
+            analysis_data: Serialized Decision JSON for cosmetic re-rendering
+
+        Returns:
+            Note ID
+        """
+        note = self.build_note(front, back, tags, deck_name, xgid, analysis_data)
+        note_id = self.add_notes([note])[0]
+        if note_id is None:
+            raise Exception("Anki-Connect error: note could not be added")
+        return note_id
 
     def find_notes_by_xgid(self, xgid: str) -> List[int]:
         """
@@ -237,9 +442,12 @@ class AnkiConnect:
         Returns:
             List of matching note IDs (may be empty)
         """
+        return self.invoke('findNotes', query=self._xgid_query(xgid))
+
+    def _xgid_query(self, xgid: str) -> str:
+        """Anki search query for AnkiGammon notes with the given XGID."""
         escaped_xgid = xgid.replace('"', '\\"')
-        query = f'"XGID:{escaped_xgid}" {self._note_type_clause()}'
-        return self.invoke('findNotes', query=query)
+        return f'"XGID:{escaped_xgid}" {self._note_type_clause()}'
 
     def update_note_fields(
         self,
@@ -316,35 +524,63 @@ class AnkiConnect:
         Returns:
             Note ID (existing or new)
         """
-        if deck_name is None:
-            deck_name = self.deck_name
+        note = self.build_note(front, back, tags, deck_name, xgid, analysis_data)
+        note_id = self.upsert_notes([note])[0]
+        if note_id is None:
+            raise Exception("Anki-Connect error: note could not be added")
+        return note_id
 
-        # Try to find existing note by XGID
-        if xgid:
-            existing_ids = self.find_notes_by_xgid(xgid)
-            if existing_ids:
-                note_id = existing_ids[0]
-                self.update_note_fields(note_id, front, back, xgid, analysis_data)
-                self.update_note_tags(note_id, tags)
-                # Move card to the correct deck (upsert may target a different deck)
-                self._move_note_to_deck(note_id, deck_name)
-                return note_id
+    def upsert_notes(self, notes: List[dict]) -> List[Optional[int]]:
+        """
+        Upsert several notes, batch_size notes at a time.
 
-        # No existing note found — add new
-        return self.add_note(front, back, tags, deck_name, xgid, analysis_data)
+        Each batch takes one findNotes request (via multi) to match XGIDs,
+        one notesInfo plus one multi request to update the matches, and one
+        addNotes request for the rest, instead of up to seven requests per
+        note. Notes sharing an XGID end up as a single note holding the
+        last one's content, as if they had been upserted one after another.
 
-    def _move_note_to_deck(self, note_id: int, deck_name: str) -> None:
-        """Move all cards of a note to the specified deck.
+        Args:
+            notes: Note dicts as built by build_note()
 
-        AnkiConnect's changeDeck operates on card IDs, so we first
-        look up the cards belonging to the note.
+        Returns:
+            Note IDs in the same order as notes (None for notes Anki rejected)
         """
-        note_info = self.invoke('notesInfo', notes=[note_id])
-        if not note_info or not note_info[0]:
-            return
-        card_ids = note_info[0].get('cards', [])
-        if card_ids:
-            self.invoke('changeDeck', cards=card_ids, deck=deck_name)
+        note_ids: List[Optional[int]] = []
+        for start in range(0, len(notes), self.batch_size):
+            note_ids.extend(self._upsert_batch(notes[start:start + self.batch_size]))
+        return note_ids
+
+    def _upsert_batch(self, notes: List[dict]) -> List[Optional[int]]:
+        """Upsert one batch of notes; see upsert_notes()."""
+        # Notes without an XGID can't be matched and are always added
+        keys = [note['fields']['XGID'] or index for index, note in enumerate(notes)]
+        latest = dict(zip(keys, notes))
+
+        xgids = [key for key in latest if isinstance(key, str)]
+        found = self.multi([('findNotes', {'query': self._xgid_query(xgid)}) for xgid in xgids])
+        note_ids = {xgid: ids[0] for xgid, ids in zip(xgids, found) if ids}
+
+        xgid_by_id = {note_id: xgid for xgid, note_id in note_ids.items()}
+        actions = []
+        for info in self.notes_info(list(xgid_by_id)):
+            if not info:
+                continue
+            note_id = info['noteId']
+            note = latest[xgid_by_id[note_id]]
+            actions.append(('updateNoteFields', {'note': {'id': note_id, 'fields': note['fields']}}))
+            if info.get('tags'):
+                actions.append(('removeTags', {'notes': [note_id], 'tags': ' '.join(info['tags'])}))
+            if note['tags']:
+                actions.append(('addTags', {'notes': [note_id], 'tags': ' '.join(note['tags'])}))
+            if info.get('cards'):
+                # Upsert may target a different deck than the note is in
+                actions.append(('changeDeck', {'cards': info['cards'], 'deck': note['deckName']}))
+        self.multi(actions)
+
+        new_keys = [key for key in latest if key not in note_ids]
+        note_ids.update(zip(new_keys, self.add_notes([latest[key] for key in new_keys])))
+        return [note_ids[key] for key in keys]
 
     def delete_notes(self, note_ids: List[int]) -> None:
         """
@@ -62,14 +62,16 @@ class CardGenerator:
         self._analyzer = analyzer
 
         # Create default renderer and animation controller with settings if not provided
-        from ankigammon.renderer.color_schemes import get_scheme
-        scheme = get_scheme(self.settings.color_scheme)
-        if self.settings.swap_checker_colors:
-            scheme = scheme.with_swapped_checkers()
-        self.renderer = renderer or SVGBoardRenderer(
-            color_scheme=scheme,
-            orientation=self.settings.board_orientation
-        )
+        if renderer is None:
+            from ankigammon.renderer.color_schemes import get_scheme
+            scheme = get_scheme(self.settings.color_scheme)
+            if self.settings.swap_checker_colors:
+                scheme = scheme.with_swapped_checkers()
+            renderer = SVGBoardRenderer(
+                color_scheme=scheme,
+                orientation=self.settings.board_orientation
+            )
+        self.renderer = renderer
         self.animation_controller = animation_controller or AnimationController(
             orientation=self.settings.board_orientation
         )
@@ -77,6 +79,10 @@ class CardGenerator:
         self.progress_callback = progress_callback
         self.cancellation_callback = cancellation_callback
 
+        # Score matrices already computed by this generator, so a position that
+        # appears on several cards is only sent through the engine once
+        self._matrix_cache: Dict[tuple, object] = {}
+
     def _get_analyzer(self):
         """Return the shared analyzer, lazily creating one if needed."""
         if self._analyzer is None:
@@ -1843,15 +1849,20 @@ class CardGenerator:
                         "is outside the displayed range."
                     )
 
-            matrix = generate_score_matrix(
-                xgid=decision.xgid,
-                match_length=effective_ml,
-                analyzer=self._get_analyzer(),
-                progress_callback=self.progress_callback,
-                cancellation_callback=self.cancellation_callback,
-                cube_value=decision.cube_value,
-                cube_owner=decision.cube_owner
-            )
+            cache_key = ('cube', decision.xgid, effective_ml,
+                         decision.cube_value, decision.cube_owner)
+            matrix = self._matrix_cache.get(cache_key)
+            if matrix is None:
+                matrix = generate_score_matrix(
+                    xgid=decision.xgid,
+                    match_length=effective_ml,
+                    analyzer=self._get_analyzer(),
+                    progress_callback=self.progress_callback,
+                    cancellation_callback=self.cancellation_callback,
+                    cube_value=decision.cube_value,
+                    cube_owner=decision.cube_owner
+                )
+                self._matrix_cache[cache_key] = matrix
 
             matrix_html = format_matrix_as_html(
                 matrix=matrix,
@@ -1911,13 +1922,17 @@ class CardGenerator:
                 format_move_matrix_as_html
             )
 
-            columns = generate_move_score_matrix(
-                xgid=decision.xgid,
-                analyzer=self._get_analyzer(),
-                max_moves=self.settings.max_moves,
-                progress_callback=self.progress_callback,
-                cancellation_callback=self.cancellation_callback
-            )
+            cache_key = ('move', decision.xgid, self.settings.max_moves)
+            columns = self._matrix_cache.get(cache_key)
+            if columns is None:
+                columns = generate_move_score_matrix(
+                    xgid=decision.xgid,
+                    analyzer=self._get_analyzer(),
+                    max_moves=self.settings.max_moves,
+                    progress_callback=self.progress_callback,
+                    cancellation_callback=self.cancellation_callback
+                )
+                self._matrix_cache[cache_key] = columns
 
             return format_move_matrix_as_html(
                 columns=columns,
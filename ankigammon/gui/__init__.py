@@ -4,5 +4,15 @@ GUI package for ankigammon desktop application.
 
 __all__ = ['MainWindow', 'main']
 
-from .main_window import MainWindow
-from .app import main
+
+def __getattr__(name):
+    # Resolved on first use so importing a submodule (gui.app for the splash
+    # screen, gui.format_detector, ...) doesn't drag in MainWindow and the
+    # QtWebEngine stack behind it
+    if name == 'MainWindow':
+        from .main_window import MainWindow
+        return MainWindow
+    if name == 'main':
+        from .app import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,14 +5,22 @@ Application entry point for GUI mode.
 import sys
 import os
 from pathlib import Path
-from PySide6.QtWidgets import QApplication, QSplashScreen, QGraphicsDropShadowEffect
+from PySide6.QtWidgets import (
+    QApplication, QSplashScreen, QGraphicsDropShadowEffect, QGraphicsPixmapItem, QGraphicsScene,
+)
 from PySide6.QtCore import Qt, QTimer, QRectF
 from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont, QLinearGradient, QPainterPath, QPen
 
-from ankigammon.gui.main_window import MainWindow
+from ankigammon import __version__
 from ankigammon.gui.resources import get_resource_path
 from ankigammon.settings import get_settings
 
+# Rendered splash is cached here between launches
+SPLASH_CACHE_DIR = Path.home() / ".ankigammon" / "cache"
+
+# Bump when changing the splash design so stale cached PNGs are re-rendered
+_SPLASH_REVISION = 2
+
 
 def set_windows_app_id():
     """
@@ -29,18 +37,18 @@ def set_windows_app_id():
             pass
 
 
-def create_splash_screen(icon_path: Path) -> QSplashScreen:
+def render_splash_pixmap(icon_path: Path) -> QPixmap:
     """
-    Create a splash screen with modern styling.
+    Paint the splash artwork.
 
-    Features rounded corners, gradient background, branded border,
-    drop shadow, and antialiased rendering.
+    Rounded corners, gradient background, branded border and antialiased
+    text, with the drop shadow baked into the transparent margin.
 
     Args:
         icon_path: Path to the application icon
 
     Returns:
-        QSplashScreen: Configured splash screen
+        QPixmap: 440x340 splash image
     """
     # Create pixmap with margin for drop shadow
     splash_pix = QPixmap(440, 340)
@@ -107,17 +115,85 @@ def create_splash_screen(icon_path: Path) -> QSplashScreen:
 
     painter.end()
 
-    # Create frameless splash screen
-    splash = QSplashScreen(splash_pix, Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+    return _bake_drop_shadow(splash_pix)
 
-    # Add drop shadow effect
+
+def _bake_drop_shadow(pixmap: QPixmap) -> QPixmap:
+    """
+    Composite a soft drop shadow under the artwork into a new pixmap.
+
+    Runs the blur once through an offscreen QGraphicsScene, so the splash
+    window doesn't carry a live effect that re-blurs on every repaint.
+    """
     shadow = QGraphicsDropShadowEffect()
     shadow.setBlurRadius(30)
     shadow.setColor(QColor(0, 0, 0, 140))
     shadow.setOffset(0, 6)
-    splash.setGraphicsEffect(shadow)
 
-    return splash
+    item = QGraphicsPixmapItem(pixmap)
+    item.setGraphicsEffect(shadow)
+    scene = QGraphicsScene()
+    scene.addItem(item)
+
+    baked = QPixmap(pixmap.size())
+    baked.fill(Qt.transparent)
+    painter = QPainter(baked)
+    bounds = QRectF(pixmap.rect())
+    scene.render(painter, bounds, bounds)
+    painter.end()
+    return baked
+
+
+def load_splash_pixmap(icon_path: Path, cache_dir: Path = SPLASH_CACHE_DIR) -> QPixmap:
+    """
+    Return the splash image, painting it only when the cached PNG is stale.
+
+    Painting the splash initializes Qt's font database and text shaping on
+    the launch path, before anything is on screen; a cached PNG loads in a
+    single decode. The cache is keyed on app version and splash revision,
+    and invalidated when the icon is newer than the cached file.
+
+    Args:
+        icon_path: Path to the application icon
+        cache_dir: Directory holding the cached PNG
+
+    Returns:
+        QPixmap: Splash image
+    """
+    cache_path = cache_dir / f"splash-{__version__}-r{_SPLASH_REVISION}.png"
+    try:
+        fresh = cache_path.stat().st_mtime >= icon_path.stat().st_mtime
+    except OSError:
+        fresh = False
+
+    if fresh:
+        splash_pix = QPixmap(str(cache_path))
+        if not splash_pix.isNull():
+            return splash_pix
+
+    splash_pix = render_splash_pixmap(icon_path)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        splash_pix.save(str(cache_path), "PNG")
+    except OSError:
+        pass  # Caching is best-effort; render again next launch
+    return splash_pix
+
+
+def create_splash_screen(icon_path: Path) -> QSplashScreen:
+    """
+    Create a frameless splash screen.
+
+    Args:
+        icon_path: Path to the application icon
+
+    Returns:
+        QSplashScreen: Configured splash screen
+    """
+    splash_pix = load_splash_pixmap(icon_path)
+
+    # Create frameless splash screen
+    return QSplashScreen(splash_pix, Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
 
 
 def main():
@@ -173,6 +249,10 @@ def main():
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
 
+    # QtWebEngine is only imported (via MainWindow) once the splash is up,
+    # after the QApplication exists; it needs shared GL contexts set first
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
     app = QApplication(sys.argv)
     app.setApplicationName("AnkiGammon")
     app.setOrganizationName("AnkiGammon")
@@ -212,6 +292,9 @@ def main():
         splash.show()
         app.processEvents()
 
+    # Deferred so the splash paints before the main window's import cost
+    from ankigammon.gui.main_window import MainWindow
+
     # Load and apply stylesheet
     style_path = get_resource_path("ankigammon/gui/resources/style.qss")
     if style_path.exists():
@@ -33,13 +33,13 @@ class DeckSyncThread(QThread):
     def run(self) -> None:
         """Fetch subdeck names from Anki in background."""
         try:
-            client = AnkiConnect()
-            if not client.test_connection():
-                logger.info("Anki not available for deck sync")
-                self.sync_failed.emit("Could not connect to Anki")
-                return
+            with AnkiConnect() as client:
+                if not client.test_connection():
+                    logger.info("Anki not available for deck sync")
+                    self.sync_failed.emit("Could not connect to Anki")
+                    return
 
-            subdecks = client.get_subdecks(self.root_deck_name)
+                subdecks = client.get_subdecks(self.root_deck_name)
             logger.info(f"Loaded {len(subdecks)} deck(s) from Anki under '{self.root_deck_name}'")
             self.decks_loaded.emit(subdecks)
 
@@ -2,27 +2,33 @@
 Export progress dialog with AnkiConnect/APKG support.
 """
 
-from typing import Dict, List
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
 from pathlib import Path
+
+import genanki
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QProgressBar,
-    QPushButton, QTextEdit, QDialogButtonBox, QFileDialog
+    QPushButton, QPlainTextEdit, QDialogButtonBox, QFileDialog
 )
-from PySide6.QtCore import Qt, QThread, Signal, Slot
+from PySide6.QtCore import Qt, QThread, QTimer, Signal, Slot
 
-from ankigammon.models import Decision
+from ankigammon.models import Decision, DecisionType
 from ankigammon.anki.ankiconnect import AnkiConnect
 from ankigammon.anki.apkg_exporter import ApkgExporter, StableNote, _deterministic_id
 from ankigammon.analysis.score_matrix import resolve_effective_match_length
 from ankigammon.anki.card_generator import CardGenerator
-from ankigammon.anki.deck_utils import find_duplicate_xgids
+from ankigammon.anki.deck_utils import apply_type_subdecks, find_duplicate_xgids
 from ankigammon.gui import silent_messagebox
 from ankigammon.renderer.svg_board_renderer import SVGBoardRenderer
-from ankigammon.renderer.color_schemes import SCHEMES
+from ankigammon.renderer.color_schemes import get_scheme
 from ankigammon.settings import Settings
 from ankigammon.utils.analyzer_base import create_analyzer
 from PySide6.QtWidgets import QMessageBox
 
+# Minimum seconds between throttled export progress updates (~30 per second)
+PROGRESS_INTERVAL = 1 / 30
+
 
 class AnalysisWorker(QThread):
     """
@@ -55,18 +61,16 @@ class AnalysisWorker(QThread):
             self.analyzer = create_analyzer(self.settings)
             analyzer = self.analyzer
 
-            # Find positions that need analysis
-            positions_to_analyze = [(i, d) for i, d in enumerate(self.decisions) if not d.candidate_moves]
-            total = len(positions_to_analyze)
+            # Indices of positions that need analysis
+            pending = [i for i, d in enumerate(self.decisions) if not d.candidate_moves]
+            total = len(pending)
 
             if total == 0:
                 self.finished.emit(True, "No analysis needed", self.decisions)
                 return
 
-            analyzed_decisions = list(self.decisions)  # Copy list
-
-            # Prepare position IDs for batch analysis
-            position_ids = [d.xgid for _, d in positions_to_analyze]
+            # Identical positions (same XGID) only need one engine run
+            position_ids = list(dict.fromkeys(self.decisions[i].xgid for i in pending))
 
             # Progress callback for parallel analysis
             def progress_callback(completed: int, total_positions: int):
@@ -80,22 +84,30 @@ class AnalysisWorker(QThread):
 
             # Analyze all positions
             self.status_message.emit(
-                f"Starting analysis of {total} position(s)..."
+                f"Starting analysis of {len(position_ids)} position(s)..."
             )
-            analysis_results = analyzer.analyze_positions_parallel(
+            analysis_results = dict(zip(position_ids, analyzer.analyze_positions_parallel(
                 position_ids,
                 progress_callback=progress_callback,
                 cancellation_callback=lambda: self._cancelled,
-            )
+            )))
 
             # Check for cancellation after batch completes
             if self._cancelled:
                 self.finished.emit(False, "Analysis cancelled by user", self.decisions)
                 return
 
-            # Parse results and update decisions
-            for idx, (pos_idx, decision) in enumerate(positions_to_analyze):
-                raw_output, decision_type = analysis_results[idx]
+            analyzer_type = getattr(self.settings, 'analyzer_type', 'gnubg')
+            if analyzer_type == "xg":
+                engine_name = f"eXtreme Gammon ({self.settings.xg_analysis_level})"
+            else:
+                engine_name = f"GnuBG ({self.settings.gnubg_analysis_ply}-ply)"
+
+            # Parse results into a copy; self.decisions stays as-is in case of failure
+            analyzed_decisions = list(self.decisions)
+            for pos_idx in pending:
+                decision = self.decisions[pos_idx]
+                raw_output, decision_type = analysis_results[decision.xgid]
 
                 analyzed_decision = analyzer.parse_analysis(
                     raw_output,
@@ -112,13 +124,6 @@ class AnalysisWorker(QThread):
                 analyzed_decision.original_position_format = decision.original_position_format
 
                 # Set source description
-                analyzer_type = getattr(self.settings, 'analyzer_type', 'gnubg')
-                if analyzer_type == "xg":
-                    level = self.settings.xg_analysis_level
-                    engine_name = f"eXtreme Gammon ({level})"
-                else:
-                    ply_level = self.settings.gnubg_analysis_ply
-                    engine_name = f"GnuBG ({ply_level}-ply)"
                 format_name = decision.original_position_format or "XGID"
                 analyzed_decision.source_description = f"Analyzed with {engine_name} from {format_name}"
 
@@ -130,6 +135,39 @@ class AnalysisWorker(QThread):
             self.finished.emit(False, f"Analysis failed: {str(e)}", self.decisions)
 
 
+class _CardProgress:
+    """
+    Progress callback handed to CardGenerator, reused for every card.
+
+    Each card owns an equal slice of the bar. Sub-steps (score matrix
+    cells) advance within that slice, capped at 95% so the bar only
+    reaches the card's end once the card is done.
+    """
+
+    __slots__ = ('_report', '_total', '_index', '_substeps', '_count')
+
+    def __init__(self, report: Callable[[float, str], None], total: int):
+        self._report = report
+        self._total = total
+        self._index = 0
+        self._substeps = 1
+        self._count = 0
+
+    def start_card(self, index: int, substeps: int):
+        """Begin counting sub-steps for the card at index."""
+        self._index = index
+        self._substeps = substeps
+        self._count = 0
+
+    def __call__(self, message: str):
+        self._count += 1
+        substep_progress = min(self._count / self._substeps, 0.95)
+        self._report(
+            (self._index + substep_progress) / self._total,
+            f"Position {self._index + 1}/{self._total}: {message}",
+        )
+
+
 class ExportWorker(QThread):
     """
     Background thread for export operations.
@@ -162,11 +200,41 @@ class ExportWorker(QThread):
         self.import_mode = import_mode
         self._cancelled = False
         self._analyzer = analyzer
+        # Working directory handed to the card generator (and APKG exporter)
+        self._output_dir = Path.home() / '.ankigammon' / 'cards'
+        self._last_progress = -1.0
+        self._last_progress_time = 0.0
+        self._last_status = None
 
     def cancel(self):
         """Request cancellation of the export."""
         self._cancelled = True
 
+    def _report_progress(self, fraction: float, message: str = None, force: bool = False):
+        """
+        Emit a progress update, dropping ones the user couldn't see.
+
+        A cube score matrix reports one sub-step per cell, and every signal
+        is a queued event for the GUI thread. Updates arriving within
+        PROGRESS_INTERVAL of the last one that moved the bar by less than
+        1% are skipped, unless force is set.
+
+        Args:
+            fraction: Overall progress (0.0 to 1.0)
+            message: Optional status text; repeats of the last one are dropped
+            force: Emit regardless of throttling (start/end of a card)
+        """
+        now = time.monotonic()
+        if (not force and now - self._last_progress_time < PROGRESS_INTERVAL
+                and fraction - self._last_progress < 0.01):
+            return
+        self._last_progress_time = now
+        self._last_progress = fraction
+        self.progress.emit(fraction)
+        if message is not None and message != self._last_status:
+            self._last_status = message
+            self.status_message.emit(message)
+
     def run(self):
         """Execute export in background thread."""
         try:
@@ -177,6 +245,102 @@ class ExportWorker(QThread):
         except Exception as e:
             self.finished.emit(False, f"Export failed: {str(e)}")
 
+    def _create_card_generator(self) -> CardGenerator:
+        """Card generator for this export, shared by every card."""
+        scheme = get_scheme(self.settings.color_scheme)
+        if self.settings.swap_checker_colors:
+            scheme = scheme.with_swapped_checkers()
+        renderer = SVGBoardRenderer(
+            color_scheme=scheme,
+            orientation=self.settings.board_orientation
+        )
+        return CardGenerator(
+            output_dir=self._output_dir,
+            show_options=self.settings.show_options,
+            interactive_moves=self.settings.interactive_moves,
+            renderer=renderer,
+            cancellation_callback=lambda: self._cancelled,
+            analyzer=self._analyzer,
+        )
+
+    def _generate_cards(
+        self,
+        export_groups: Dict[str, List[Decision]],
+        card_gen: CardGenerator,
+        numbered_card_ids: bool = False,
+    ) -> Iterator[Tuple[str, dict]]:
+        """
+        Generate a card for every decision, reporting progress as it goes.
+
+        Args:
+            export_groups: Deck name -> decisions to export into that deck
+            card_gen: Generator shared by every card in this export
+            numbered_card_ids: Give cards sequential IDs (card_0, card_1, ...)
+                instead of random ones, for reproducible APKG output
+
+        Yields:
+            (deck_name, card_data) for each decision, in order
+
+        Raises:
+            InterruptedError: If the export is cancelled
+            RuntimeError: If a card fails to render, with the position's details
+        """
+        total = len(self.all_decisions)
+        card_index = 0
+
+        # Settings don't change during an export, so probe the engine once
+        # rather than hitting the filesystem for every decision
+        analyzer_available = (
+            self.settings.is_xg_available() if getattr(self.settings, 'analyzer_type', 'gnubg') == 'xg'
+            else self.settings.is_gnubg_available()
+        )
+        cube_matrix_enabled = analyzer_available and self.settings.get('generate_score_matrix', False)
+        move_matrix_enabled = analyzer_available and self.settings.get('generate_move_score_matrix', False)
+        score_matrix_max_size = self.settings.get('score_matrix_max_size', 0)
+
+        progress = _CardProgress(self._report_progress, total)
+        card_gen.progress_callback = progress
+
+        for deck_name, deck_decisions in export_groups.items():
+            for decision in deck_decisions:
+                if self._cancelled:
+                    raise InterruptedError("Export cancelled by user")
+
+                # Calculate sub-steps for progress tracking
+                decision_type = decision.decision_type
+                has_cube_score_matrix = cube_matrix_enabled and decision_type == DecisionType.CUBE_ACTION
+                has_move_score_matrix = (
+                    move_matrix_enabled and
+                    decision_type == DecisionType.CHECKER_PLAY and
+                    decision.dice
+                )
+                cube_effective_ml = resolve_effective_match_length(
+                    decision.match_length, score_matrix_max_size,
+                ) if has_cube_score_matrix else 0
+                cube_matrix_steps = (cube_effective_ml - 1) ** 2 if cube_effective_ml >= 2 else 0
+                move_matrix_steps = 4 if has_move_score_matrix else 0  # 4 score types analyzed
+                # The bar already sits at card_index / total: either the
+                # exporter's initial 0.0 or the previous card's final update
+                progress.start_card(card_index, max(1, cube_matrix_steps + move_matrix_steps))
+
+                card_id = f"card_{card_index}" if numbered_card_ids else None
+                try:
+                    card_data = card_gen.generate_card(decision, card_id=card_id)
+                except InterruptedError:
+                    raise
+                except Exception as e:
+                    raise RuntimeError(
+                        f"Failed to render position {card_index+1}/{total} "
+                        f"(xgid={decision.xgid!r}, dice={decision.dice}, "
+                        f"type={decision.decision_type.name}): {e}"
+                    ) from e
+
+                yield deck_name, card_data
+
+                # Update progress after the card has been consumed
+                card_index += 1
+                self._report_progress(card_index / total, force=True)
+
     def _export_ankiconnect(self):
         """Export via AnkiConnect."""
         self.status_message.emit("Connecting to Anki...")
@@ -189,7 +353,6 @@ class ExportWorker(QThread):
             return
 
         # Apply type subdecks if enabled
-        from ankigammon.anki.deck_utils import apply_type_subdecks
         export_groups = self.grouped_decisions
         if self.settings.use_subdecks_by_type:
             export_groups = apply_type_subdecks(export_groups)
@@ -209,119 +372,69 @@ class ExportWorker(QThread):
         # Generate cards
         self.status_message.emit("Generating cards...")
 
-        # Create renderer with color scheme and orientation
-        color_scheme = SCHEMES.get(self.settings.color_scheme, SCHEMES['classic'])
-        if self.settings.swap_checker_colors:
-            color_scheme = color_scheme.with_swapped_checkers()
-        renderer = SVGBoardRenderer(
-            color_scheme=color_scheme,
-            orientation=self.settings.board_orientation
-        )
-
         # Export decisions across all deck groups
         total = len(self.all_decisions)
         card_index = 0
-        output_dir = Path.home() / '.ankigammon' / 'cards'
-        card_gen = CardGenerator(
-            output_dir=output_dir,
-            show_options=self.settings.show_options,
-            interactive_moves=self.settings.interactive_moves,
-            renderer=renderer,
-            cancellation_callback=lambda: self._cancelled,
-            analyzer=self._analyzer,
-        )
-
-        for deck_name, deck_decisions in export_groups.items():
-            for decision in deck_decisions:
-                i = card_index
-                card_index += 1
+        card_gen = self._create_card_generator()
+
+        # Notes are queued and sent to Anki a batch at a time
+        pending_notes = []
+        rejected_cards = []  # Card numbers Anki refused to add
+        send_notes = client.upsert_notes if self.import_mode == "upsert" else client.add_notes
+
+        def flush_pending_notes() -> bool:
+            if not pending_notes:
+                return True
+            first = card_index - len(pending_notes) + 1
+            self.status_message.emit(f"Adding cards {first}-{card_index}/{total} to Anki...")
+            try:
+                note_ids = send_notes(pending_notes)
+            except Exception as e:
+                self.finished.emit(False, f"Failed to add cards {first}-{card_index}: {str(e)}")
+                return False
+            rejected_cards.extend(
+                first + offset for offset, note_id in enumerate(note_ids) if note_id is None
+            )
+            pending_notes.clear()
+            return True
 
-                # Check for cancellation
-                if self._cancelled:
-                    self.finished.emit(False, "Export cancelled by user")
+        try:
+            for card_index, (deck_name, card_data) in enumerate(
+                    self._generate_cards(export_groups, card_gen), 1):
+                # Add to Anki with the deck name from our grouped structure
+                pending_notes.append(client.build_note(
+                    front=card_data['front'],
+                    back=card_data['back'],
+                    tags=card_data.get('tags', []),
+                    deck_name=deck_name,
+                    xgid=card_data.get('xgid', ''),
+                    analysis_data=card_data.get('analysis_data', '')
+                ))
+                if len(pending_notes) >= client.batch_size and not flush_pending_notes():
                     return
-
-                # Calculate base progress for this position
-                base_progress = i / total
-                position_progress_range = 1.0 / total
-
-                # Calculate sub-steps for progress tracking
-                analyzer_available = (
-                    self.settings.is_xg_available() if getattr(self.settings, 'analyzer_type', 'gnubg') == 'xg'
-                    else self.settings.is_gnubg_available()
-                )
-                has_cube_score_matrix = (
-                    decision.decision_type.name == 'CUBE_ACTION' and
-                    self.settings.get('generate_score_matrix', False) and
-                    analyzer_available
-                )
-                has_move_score_matrix = (
-                    decision.decision_type.name == 'CHECKER_PLAY' and
-                    decision.dice and
-                    self.settings.get('generate_move_score_matrix', False) and
-                    analyzer_available
+        except InterruptedError:
+            if flush_pending_notes():
+                self.finished.emit(False, "Export cancelled by user")
+            return
+        except RuntimeError as e:
+            # Cards built before the failing one still go to Anki
+            if flush_pending_notes():
+                added = card_index - len(rejected_cards)
+                self.finished.emit(
+                    False, f"Export failed after adding {added}/{total} card(s) to Anki: {e}"
                 )
-                cube_effective_ml = resolve_effective_match_length(
-                    decision.match_length,
-                    self.settings.get('score_matrix_max_size', 0),
-                ) if has_cube_score_matrix else 0
-                cube_matrix_steps = (cube_effective_ml - 1) ** 2 if cube_effective_ml >= 2 else 0
-                move_matrix_steps = 4 if has_move_score_matrix else 0
-                total_substeps = max(1, cube_matrix_steps + move_matrix_steps)
-
-                current_substep = [0]
-
-                def progress_callback(message: str, _i=i, _total_substeps=total_substeps,
-                                      _base_progress=base_progress, _range=position_progress_range):
-                    current_substep[0] += 1
-                    substep_progress = min(current_substep[0] / _total_substeps, 0.95)
-                    overall_progress = _base_progress + (substep_progress * _range)
-                    self.progress.emit(overall_progress)
-                    self.status_message.emit(f"Position {_i+1}/{total}: {message}")
-
-                card_gen.progress_callback = progress_callback
-
-                self.progress.emit(base_progress)
-
-                try:
-                    card_data = card_gen.generate_card(decision)
-                except InterruptedError:
-                    self.finished.emit(False, "Export cancelled by user")
-                    return
-                except Exception as e:
-                    raise RuntimeError(
-                        f"Failed to render position {i+1}/{total} "
-                        f"(xgid={decision.xgid!r}, dice={decision.dice}, "
-                        f"type={decision.decision_type.name}): {e}"
-                    ) from e
+            return
 
-                # Add to Anki with the deck name from our grouped structure
-                self.status_message.emit(f"Position {i+1}/{total}: Adding to Anki...")
-                self.progress.emit(base_progress + (0.95 * position_progress_range))
-                try:
-                    if self.import_mode == "upsert":
-                        client.upsert_note(
-                            front=card_data['front'],
-                            back=card_data['back'],
-                            tags=card_data.get('tags', []),
-                            deck_name=deck_name,
-                            xgid=card_data.get('xgid', ''),
-                            analysis_data=card_data.get('analysis_data', '')
-                        )
-                    else:
-                        client.add_note(
-                            front=card_data['front'],
-                            back=card_data['back'],
-                            tags=card_data.get('tags', []),
-                            deck_name=deck_name,
-                            xgid=card_data.get('xgid', ''),
-                            analysis_data=card_data.get('analysis_data', '')
-                        )
-                except Exception as e:
-                    self.finished.emit(False, f"Failed to add card {i+1}: {str(e)}")
-                    return
+        if not flush_pending_notes():
+            return
 
-                self.progress.emit((i + 1) / total)
+        if rejected_cards:
+            self.finished.emit(
+                False,
+                f"Anki rejected {len(rejected_cards)} of {total} card(s) "
+                f"(card {', '.join(map(str, rejected_cards))})"
+            )
+            return
 
         unique_xgids = len({d.xgid for d in self.all_decisions if d.xgid})
         if unique_xgids and unique_xgids < total:
@@ -344,27 +457,11 @@ class ExportWorker(QThread):
 
         try:
             # Use existing APKG exporter for model creation
-            output_dir = Path.home() / '.ankigammon' / 'cards'
             exporter = ApkgExporter(
-                output_dir=output_dir,
+                output_dir=self._output_dir,
                 deck_name=self.settings.deck_name
             )
 
-            # Custom export loop with progress tracking
-            from ankigammon.renderer.color_schemes import get_scheme
-            from ankigammon.renderer.svg_board_renderer import SVGBoardRenderer
-            from ankigammon.anki.card_generator import CardGenerator
-            from ankigammon.anki.deck_utils import apply_type_subdecks
-            import genanki
-
-            scheme = get_scheme(self.settings.color_scheme)
-            if self.settings.swap_checker_colors:
-                scheme = scheme.with_swapped_checkers()
-            renderer = SVGBoardRenderer(
-                color_scheme=scheme,
-                orientation=self.settings.board_orientation
-            )
-
             # Apply type subdecks if enabled
             export_groups = self.grouped_decisions
             if self.settings.use_subdecks_by_type:
@@ -377,85 +474,11 @@ class ExportWorker(QThread):
                 decks_dict[deck_name] = genanki.Deck(deck_id, deck_name)
 
             # Generate cards and add to appropriate decks
-            total = len(self.all_decisions)
-            card_index = 0
-            card_gen = CardGenerator(
-                output_dir=output_dir,
-                show_options=self.settings.show_options,
-                interactive_moves=self.settings.interactive_moves,
-                renderer=renderer,
-                cancellation_callback=lambda: self._cancelled,
-                analyzer=self._analyzer,
-            )
-
-            for deck_name, deck_decisions in export_groups.items():
-                deck = decks_dict[deck_name]
-
-                for decision in deck_decisions:
-                    # Check for cancellation
-                    if self._cancelled:
-                        self.finished.emit(False, "Export cancelled by user")
-                        return
+            card_gen = self._create_card_generator()
 
-                    # Calculate base progress for this position
-                    base_progress = card_index / total
-                    position_progress_range = 1.0 / total
-
-                    # Calculate sub-steps for progress tracking
-                    apkg_analyzer_available = (
-                        self.settings.is_xg_available() if getattr(self.settings, 'analyzer_type', 'gnubg') == 'xg'
-                        else self.settings.is_gnubg_available()
-                    )
-                    has_cube_score_matrix = (
-                        decision.decision_type.name == 'CUBE_ACTION' and
-                        self.settings.get('generate_score_matrix', False) and
-                        apkg_analyzer_available
-                    )
-                    has_move_score_matrix = (
-                        decision.decision_type.name == 'CHECKER_PLAY' and
-                        decision.dice and
-                        self.settings.get('generate_move_score_matrix', False) and
-                        apkg_analyzer_available
-                    )
-                    cube_effective_ml = resolve_effective_match_length(
-                        decision.match_length,
-                        self.settings.get('score_matrix_max_size', 0),
-                    ) if has_cube_score_matrix else 0
-                    cube_matrix_steps = (cube_effective_ml - 1) ** 2 if cube_effective_ml >= 2 else 0
-                    move_matrix_steps = 4 if has_move_score_matrix else 0  # 4 score types analyzed
-                    total_substeps = max(1, cube_matrix_steps + move_matrix_steps)
-
-                    current_substep = [0]
-                    current_card_index = card_index  # Capture for closure
-
-                    # Update progress callback for this position's sub-steps
-                    def make_progress_callback(idx):
-                        def apkg_progress_callback(message: str):
-                            current_substep[0] += 1
-                            substep_progress = min(current_substep[0] / total_substeps, 0.95)
-                            overall_progress = base_progress + (substep_progress * position_progress_range)
-                            self.progress.emit(overall_progress)
-                            self.status_message.emit(f"Position {idx+1}/{total}: {message}")
-                        return apkg_progress_callback
-
-                    card_gen.progress_callback = make_progress_callback(current_card_index)
-
-                    self.progress.emit(base_progress)
-
-                    # Generate card
-                    try:
-                        card_data = card_gen.generate_card(decision, card_id=f"card_{card_index}")
-                    except InterruptedError:
-                        self.finished.emit(False, "Export cancelled by user")
-                        return
-                    except Exception as e:
-                        raise RuntimeError(
-                            f"Failed to render position {card_index+1}/{total} "
-                            f"(xgid={decision.xgid!r}, dice={decision.dice}, "
-                            f"type={decision.decision_type.name}): {e}"
-                        ) from e
-
-                    # Create note
+            try:
+                for deck_name, card_data in self._generate_cards(
+                        export_groups, card_gen, numbered_card_ids=True):
                     note = StableNote(
                         model=exporter.model,
                         fields=[
@@ -466,13 +489,10 @@ class ExportWorker(QThread):
                         ],
                         tags=card_data['tags']
                     )
-
-                    # Add to appropriate deck
-                    deck.add_note(note)
-
-                    # Update progress after card added
-                    card_index += 1
-                    self.progress.emit(card_index / total)
+                    decks_dict[deck_name].add_note(note)
+            except InterruptedError:
+                self.finished.emit(False, "Export cancelled by user")
+                return
 
             # Write APKG file with all decks
             self.status_message.emit("Writing APKG file...")
@@ -556,13 +576,20 @@ class ExportDialog(QDialog):
         layout.addWidget(self.status_label)
 
         # Log text (hidden initially)
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(150)
         self.log_text.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.log_text.hide()
         layout.addWidget(self.log_text)
 
+        # Status lines are buffered and appended to the log in batches
+        self._log_buffer: List[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+
         # Buttons
         self.button_box = QDialogButtonBox()
         self.btn_export = QPushButton("Export")
@@ -688,8 +715,8 @@ class ExportDialog(QDialog):
             # Save the directory for next time
             self.settings.last_apkg_directory = str(Path(self.output_path).parent)
 
-        # Check if any positions need analysis
-        needs_analysis = [d for d in self.all_decisions if not d.candidate_moves]
+        # Count positions that need analysis
+        needs_analysis = sum(1 for d in self.all_decisions if not d.candidate_moves)
 
         if needs_analysis:
             # Verify the configured analyzer is available
@@ -703,7 +730,7 @@ class ExportDialog(QDialog):
 
             if not analyzer_available:
                 self.status_label.setText(
-                    f"Cannot export: {len(needs_analysis)} position(s) need analysis "
+                    f"Cannot export: {needs_analysis} position(s) need analysis "
                     f"but {engine_name} is not configured.\n"
                     "Please configure an analysis engine in Settings, or import an analyzed file."
                 )
@@ -711,12 +738,16 @@ class ExportDialog(QDialog):
                 return
 
             # Run analysis first (flat list — analysis doesn't care about deck grouping)
-            self.status_label.setText(f"Analyzing {len(needs_analysis)} position(s) with {engine_name}...")
+            self.status_label.setText(f"Analyzing {needs_analysis} position(s) with {engine_name}...")
             self.analysis_worker = AnalysisWorker(self.all_decisions, self.settings)
             self.analysis_worker.progress.connect(self.on_analysis_progress)
             self.analysis_worker.status_message.connect(self.on_status_message)
             self.analysis_worker.finished.connect(self.on_analysis_finished)
-            self.analysis_worker.start()
+            # The engine reports nothing until a position is done, which can
+            # take a while at high plies; show a busy bar until then
+            self.progress_bar.setRange(0, 0)
+            # Below-normal priority so the dialog keeps repainting on busy machines
+            self.analysis_worker.start(QThread.LowPriority)
         else:
             # No analysis needed, proceed with export
             self._start_export_worker()
@@ -746,17 +777,21 @@ class ExportDialog(QDialog):
         self.worker.finished.connect(self.on_finished)
 
         # Start export
-        self.worker.start()
+        self.worker.start(QThread.LowPriority)
 
     @Slot(int, int)
     def on_analysis_progress(self, current, total):
         """Update progress bar for analysis (0-50% of total progress)."""
+        if current > 0:
+            self.progress_bar.setRange(0, 100)
         # Analysis takes first half of progress bar (0-50%)
         self.progress_bar.setValue(int((current / total) * 50))
 
     @Slot(bool, str, list)
     def on_analysis_finished(self, success, message, analyzed_decisions):
         """Handle analysis completion."""
+        self.progress_bar.setRange(0, 100)
+
         # Check if user requested to close
         if self._closing:
             self._cleanup_analyzer()
@@ -780,7 +815,8 @@ class ExportDialog(QDialog):
             # Analysis failed — clean up headless XG process
             self._cleanup_analyzer()
             self.status_label.setText(f"Analysis failed: {message}")
-            self.log_text.append(f"ERROR: {message}")
+            self._log_buffer.append(f"ERROR: {message}")
+            self._flush_log()
             self.btn_export.setEnabled(True)
 
     @Slot(float)
@@ -804,7 +840,17 @@ class ExportDialog(QDialog):
     def on_status_message(self, message):
         """Update status label."""
         self.status_label.setText(message)
-        self.log_text.append(message)
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append buffered status lines to the log in one go."""
+        self._log_timer.stop()
+        if not self._log_buffer:
+            return
+        self.log_text.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
         if self.log_text.isHidden():
             self.log_text.show()
 
@@ -820,7 +866,8 @@ class ExportDialog(QDialog):
             return
 
         self.status_label.setText(message)
-        self.log_text.append(f"\n{'SUCCESS' if success else 'FAILED'}: {message}")
+        self._log_buffer.append(f"\n{'SUCCESS' if success else 'FAILED'}: {message}")
+        self._flush_log()
 
         if success:
             self.btn_export.hide()
@@ -6,7 +6,11 @@ Supports:
 - Full XG analysis text - parsed directly
 """
 
-from typing import List, Optional
+import json
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 import qtawesome as qta
@@ -17,7 +21,7 @@ from PySide6.QtWidgets import (
     QFrame, QSplitter, QWidget, QProgressDialog, QMenu,
     QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QAction, QKeyEvent
 from PySide6.QtWebEngineWidgets import QWebEngineView
 
@@ -35,35 +39,84 @@ from ankigammon.gui.format_detector import InputFormat
 from ankigammon.gui.dialogs.note_dialog import NoteEditDialog
 
 
+# XGID: optional prefix, then the 26-character board field
+_XGID_RE = re.compile(r'(?:XGID=)?[^:]{26}:')
+
+# GNUID: Position ID (14 chars) and Match ID (12 chars), base64 encoded
+_GNUID_RE = re.compile(r'[A-Za-z0-9+/]{14}:[A-Za-z0-9+/]{12}(?::|$)')
+
+
+def _classify_position_id(position_id: str) -> Optional[str]:
+    """
+    Tell which position ID format a line is in, without parsing it.
+
+    Returns "XGID", "GNUID" or "OGID", or None if the line is none of them.
+    The checks are unambiguous: an OGID's first field lists at most 15
+    checkers, so it is never the 26 characters of an XGID board, and a
+    GNUID is two base64 fields of exactly 14 and 12 characters.
+    """
+    if _XGID_RE.match(position_id):
+        return "XGID"
+    if _GNUID_RE.match(position_id):
+        return "GNUID"
+    if ':' in position_id:
+        return "OGID"
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_position_id_cached(position_id: str) -> Optional[Tuple[Position, Dict, str]]:
+    """
+    Parse a position ID in whichever format it is written in.
+
+    Returns (position, metadata, format name), or None if it is not valid.
+    Results are cached, so callers must not modify them.
+    """
+    kind = _classify_position_id(position_id)
+    try:
+        if kind == "XGID":
+            return (*parse_xgid(position_id), kind)
+        if kind == "GNUID":
+            return (*parse_gnuid(position_id), kind)
+        if kind == "OGID":
+            return (*parse_ogid(position_id), kind)
+    except (ValueError, KeyError, IndexError):
+        pass
+    return None
+
+
 class PendingPositionItem(QListWidgetItem):
     """List item for a pending position."""
 
+    # Status icons, shared by all items once created
+    _icon_pending = None
+    _icon_analyzed = None
+
     def __init__(self, decision: Decision, needs_analysis: bool = False, score_format: str = "absolute"):
         super().__init__()
         self.decision = decision
         self.needs_analysis = needs_analysis
         self.score_format = score_format
 
-        # Set display text
-        self._update_display()
+        # Text that depends only on the position, formatted once
+        self._tooltip_base = decision.get_metadata_text(score_format)
+        self.setText(decision.get_short_display_text(score_format))
+
+        self.refresh_status()
 
-    def _update_display(self):
-        """Update display text based on decision."""
-        # Use consistent display format
-        self.setText(self.decision.get_short_display_text(self.score_format))
+    def refresh_status(self, needs_analysis: Optional[bool] = None):
+        """Update the icon and tooltip after the analysis status or note changes."""
+        if needs_analysis is not None:
+            self.needs_analysis = needs_analysis
 
         # Icon based on analysis status
-        if self.needs_analysis:
-            self.setIcon(qta.icon('fa6s.magnifying-glass', color='#89b4fa'))  # Info blue
-        else:
-            self.setIcon(qta.icon('fa6s.circle-check', color='#a6e3a1'))  # Success green
+        self.setIcon(self._get_icon(self.needs_analysis))
 
         # Tooltip with metadata + analysis status
-        tooltip = self.decision.get_metadata_text(self.score_format)
         if self.needs_analysis:
-            tooltip += "\n\nNeeds GnuBG analysis"
+            tooltip = f"{self._tooltip_base}\n\nNeeds GnuBG analysis"
         else:
-            tooltip += f"\n\n{len(self.decision.candidate_moves)} moves analyzed"
+            tooltip = f"{self._tooltip_base}\n\n{len(self.decision.candidate_moves)} moves analyzed"
 
         # Add note if present
         if self.decision.note:
@@ -71,6 +124,17 @@ class PendingPositionItem(QListWidgetItem):
 
         self.setToolTip(tooltip)
 
+    @classmethod
+    def _get_icon(cls, needs_analysis: bool):
+        """Get the status icon, creating it on first use."""
+        if needs_analysis:
+            if cls._icon_pending is None:
+                cls._icon_pending = qta.icon('fa6s.magnifying-glass', color='#89b4fa')  # Info blue
+            return cls._icon_pending
+        if cls._icon_analyzed is None:
+            cls._icon_analyzed = qta.icon('fa6s.circle-check', color='#a6e3a1')  # Success green
+        return cls._icon_analyzed
+
 
 class PendingListWidget(QListWidget):
     """Custom list widget for pending positions with deletion support."""
@@ -84,6 +148,9 @@ class PendingListWidget(QListWidget):
         # Enable smooth scrolling
         self.setVerticalScrollMode(QListWidget.ScrollPerPixel)
 
+        # Every row is one line of text with an icon, so rows need not be measured one by one
+        self.setUniformItemSizes(True)
+
         # Enable multi-selection with Ctrl/Shift+Click
         self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
 
@@ -91,26 +158,8 @@ class PendingListWidget(QListWidget):
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
 
-        # Set styling
-        self.setStyleSheet("""
-            QListWidget {
-                background-color: #1e1e2e;
-                border: 2px solid #313244;
-                border-radius: 8px;
-                padding: 8px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-radius: 4px;
-                color: #cdd6f4;
-            }
-            QListWidget::item:selected {
-                background-color: #45475a;
-            }
-            QListWidget::item:hover {
-                background-color: #313244;
-            }
-        """)
+        # Styled in style.qss
+        self.setObjectName("pending_list")
 
     @Slot()
     def _show_context_menu(self, pos):
@@ -166,14 +215,7 @@ class PendingListWidget(QListWidget):
             item.decision.note = new_note.strip() if new_note.strip() else None
 
             # Update tooltip to reflect the new note
-            tooltip = item.decision.get_metadata_text(self.settings.score_format)
-            if item.needs_analysis:
-                tooltip += "\n\nNeeds GnuBG analysis"
-            else:
-                tooltip += f"\n\n{len(item.decision.candidate_moves)} moves analyzed"
-            if item.decision.note:
-                tooltip += f"\n\nNote: {item.decision.note}"
-            item.setToolTip(tooltip)
+            item.refresh_status()
 
     def _delete_selected_items(self):
         """Delete all selected items from the list with confirmation."""
@@ -202,7 +244,8 @@ class PendingListWidget(QListWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             # Delete in descending order to avoid index shifting
-            rows_to_delete = sorted([self.row(item) for item in selected_items], reverse=True)
+            # Rows come straight from the selection model, no per-item row() search
+            rows_to_delete = sorted((index.row() for index in self.selectedIndexes()), reverse=True)
             for row in rows_to_delete:
                 self.takeItem(row)
 
@@ -231,10 +274,68 @@ class InputDialog(QDialog):
 
     positions_added = Signal(list)
 
+    # Delay before rendering a newly selected position's preview
+    PREVIEW_DELAY_MS = 80
+
+    # Number of rendered previews kept for revisiting positions
+    PREVIEW_CACHE_SIZE = 64
+
+    EMPTY_PREVIEW_MARKUP = '<p class="empty">Select a position to preview</p>'
+
+    # Loaded once; selecting a position only swaps the contents of #board
+    PREVIEW_PAGE_HTML = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                html, body {{
+                    margin: 0;
+                    padding: 0;
+                    height: 100%;
+                    overflow: hidden;
+                }}
+                body {{
+                    padding: 10px;
+                    background: #1e1e2e;
+                    box-sizing: border-box;
+                }}
+                #board {{
+                    height: 100%;
+                    display: flex;
+                    justify-content: center;
+                    align-items: center;
+                }}
+                svg {{
+                    max-width: 100%;
+                    max-height: 100%;
+                    height: auto;
+                }}
+                .empty {{
+                    align-self: flex-start;
+                    margin: 26px 0 0;
+                    color: #6c7086;
+                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                }}
+            </style>
+        </head>
+        <body>
+            <div id="board">{EMPTY_PREVIEW_MARKUP}</div>
+        </body>
+        </html>
+        """
+
     def __init__(self, settings: Settings, parent=None):
         super().__init__(parent)
         self.settings = settings
         self.pending_decisions: List[Decision] = []
+        self._preview_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._preview_loaded = False
+        self._preview_markup = self.EMPTY_PREVIEW_MARKUP
+        self._pending_preview_decision: Optional[Decision] = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self.PREVIEW_DELAY_MS)
+        self._preview_timer.timeout.connect(self._render_pending_preview)
         scheme = get_scheme(settings.color_scheme)
         if settings.swap_checker_colors:
             scheme = scheme.with_swapped_checkers()
@@ -243,6 +344,7 @@ class InputDialog(QDialog):
             orientation=settings.board_orientation
         )
 
+        self.setObjectName("input_dialog")
         self.setWindowTitle("Add Positions")
         self.setModal(True)
         self.setMinimumSize(800, 600)
@@ -284,41 +386,13 @@ class InputDialog(QDialog):
         button_layout.addStretch()
 
         self.btn_done = QPushButton("Done")
-        self.btn_done.setStyleSheet("""
-            QPushButton {
-                background-color: #89b4fa;
-                color: #1e1e2e;
-                border: none;
-                padding: 10px 24px;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #a0c8fc;
-            }
-            QPushButton:pressed {
-                background-color: #74c7ec;
-            }
-        """)
+        self.btn_done.setObjectName("btn_done")
         self.btn_done.setCursor(Qt.PointingHandCursor)
         self.btn_done.clicked.connect(self.accept)
         button_layout.addWidget(self.btn_done)
 
         self.btn_cancel = QPushButton("Cancel")
-        self.btn_cancel.setStyleSheet("""
-            QPushButton {
-                background-color: #45475a;
-                color: #cdd6f4;
-                border: none;
-                padding: 10px 24px;
-                border-radius: 6px;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #585b70;
-            }
-        """)
+        self.btn_cancel.setObjectName("btn_cancel")
         self.btn_cancel.setCursor(Qt.PointingHandCursor)
         self.btn_cancel.clicked.connect(self.reject)
         button_layout.addWidget(self.btn_cancel)
@@ -343,40 +417,13 @@ class InputDialog(QDialog):
         button_layout = QHBoxLayout()
 
         self.btn_add = QPushButton("Add to List")
-        self.btn_add.setStyleSheet("""
-            QPushButton {
-                background-color: #a6e3a1;
-                color: #1e1e2e;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 6px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #94e2d5;
-            }
-            QPushButton:disabled {
-                background-color: #45475a;
-                color: #6c7086;
-            }
-        """)
+        self.btn_add.setObjectName("btn_add")
         self.btn_add.setCursor(Qt.PointingHandCursor)
         self.btn_add.clicked.connect(self._on_add_clicked)
         button_layout.addWidget(self.btn_add)
 
         self.btn_clear = QPushButton("Clear Input")
-        self.btn_clear.setStyleSheet("""
-            QPushButton {
-                background-color: #45475a;
-                color: #cdd6f4;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #585b70;
-            }
-        """)
+        self.btn_clear.setObjectName("btn_clear")
         self.btn_clear.setCursor(Qt.PointingHandCursor)
         self.btn_clear.clicked.connect(self.input_widget.clear_text)
         button_layout.addWidget(self.btn_clear)
@@ -407,20 +454,7 @@ class InputDialog(QDialog):
         header_layout.addStretch()
 
         self.btn_clear_all = QPushButton("Clear All")
-        self.btn_clear_all.setStyleSheet("""
-            QPushButton {
-                background-color: #45475a;
-                color: #cdd6f4;
-                border: none;
-                padding: 4px 12px;
-                border-radius: 4px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #f38ba8;
-                color: #1e1e2e;
-            }
-        """)
+        self.btn_clear_all.setObjectName("btn_clear_all")
         self.btn_clear_all.setCursor(Qt.PointingHandCursor)
         self.btn_clear_all.clicked.connect(self._on_clear_all_clicked)
         header_layout.addWidget(self.btn_clear_all)
@@ -447,11 +481,17 @@ class InputDialog(QDialog):
         preview_label.setStyleSheet("font-weight: 600; color: #cdd6f4;")
         preview_layout.addWidget(preview_label)
 
-        self.preview = QWebEngineView()
-        self.preview.setContextMenuPolicy(Qt.NoContextMenu)
-        self.preview.setMinimumHeight(250)
-        self.preview.setHtml(self._get_empty_preview_html())
-        preview_layout.addWidget(self.preview, stretch=1)
+        # The web view is created when the first position is previewed;
+        # until then a plain label stands in for the empty page
+        self.preview = None
+        self._preview_layout = preview_layout
+        self._preview_placeholder = QLabel("Select a position to preview")
+        self._preview_placeholder.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
+        self._preview_placeholder.setMinimumHeight(250)
+        self._preview_placeholder.setStyleSheet(
+            "background-color: #1e1e2e; color: #6c7086; padding-top: 36px;"
+        )
+        preview_layout.addWidget(self._preview_placeholder, stretch=1)
 
         splitter.addWidget(preview_container)
 
@@ -518,13 +558,21 @@ class InputDialog(QDialog):
                 return
 
             # Add to pending list
-            for decision in decisions:
-                # Check if decision has analysis data
-                needs_analysis = not bool(decision.candidate_moves)
-                self.pending_decisions.append(decision)
-
-                item = PendingPositionItem(decision, needs_analysis, self.settings.score_format)
-                self.pending_list.addItem(item)
+            items = [
+                PendingPositionItem(decision, not decision.candidate_moves, self.settings.score_format)
+                for decision in decisions
+            ]
+            self.pending_decisions.extend(decisions)
+
+            # Insert as one batch so the list repaints once
+            self.pending_list.setUpdatesEnabled(False)
+            self.pending_list.blockSignals(True)
+            try:
+                for item in items:
+                    self.pending_list.addItem(item)
+            finally:
+                self.pending_list.blockSignals(False)
+                self.pending_list.setUpdatesEnabled(True)
 
             # Update count
             self._update_count_label()
@@ -561,10 +609,10 @@ class InputDialog(QDialog):
             # Try parsing as position IDs (XGID, GNUID, or OGID)
             decisions = []
 
-            # Split by lines
-            lines = [line.strip() for line in text.split('\n') if line.strip()]
-
-            for line in lines:
+            for line in text.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
                 decision = self._parse_position_id(line)
                 if decision:
                     decisions.append(decision)
@@ -573,37 +621,20 @@ class InputDialog(QDialog):
 
         return []
 
-    def _parse_position_id(self, position_id: str) -> Decision:
+    def _parse_position_id(self, position_id: str) -> Optional[Decision]:
         """Parse a single position ID (XGID, GNUID, or OGID) into a Decision."""
-        # Try XGID
-        if 'XGID=' in position_id or ':' in position_id:
-            try:
-                position, metadata = parse_xgid(position_id)
-                return self._create_decision_from_metadata(
-                    position, metadata, original_xgid=position_id
-                )
-            except:
-                pass
-
-        # Try GNUID
-        if ':' in position_id:
-            parts = position_id.split(':')
-            if len(parts) >= 2 and len(parts[0]) == 14 and len(parts[1]) == 12:
-                try:
-                    position, metadata = parse_gnuid(position_id)
-                    return self._create_decision_from_metadata(position, metadata, original_format="GNUID")
-                except:
-                    pass
-
-        # Try OGID
-        if ':' in position_id:
-            try:
-                position, metadata = parse_ogid(position_id)
-                return self._create_decision_from_metadata(position, metadata, original_format="OGID")
-            except:
-                pass
-
-        return None
+        parsed = _parse_position_id_cached(position_id)
+        if parsed is None:
+            return None
+
+        # The cached objects are shared, so hand out copies
+        position, metadata, original_format = parsed
+        position = Position(points=list(position.points), x_off=position.x_off, o_off=position.o_off)
+        if original_format == "XGID":
+            return self._create_decision_from_metadata(
+                position, dict(metadata), original_xgid=position_id
+            )
+        return self._create_decision_from_metadata(position, dict(metadata), original_format=original_format)
 
     def _create_decision_from_metadata(
         self,
@@ -682,9 +713,10 @@ class InputDialog(QDialog):
 
         if reply == QMessageBox.StandardButton.Yes:
             self.pending_decisions.clear()
+            self._preview_cache.clear()
             self.pending_list.clear()
             self._update_count_label()
-            self.preview.setHtml(self._get_empty_preview_html())
+            self._show_empty_preview()
 
     @Slot(list)
     def _on_items_deleted(self, indices: list):
@@ -699,20 +731,79 @@ class InputDialog(QDialog):
 
         # Clear preview if no items remain or no selection
         if not self.pending_decisions:
-            self.preview.setHtml(self._get_empty_preview_html())
+            self._preview_cache.clear()
+            self._show_empty_preview()
 
     @Slot(QListWidgetItem, QListWidgetItem)
     def _on_selection_changed(self, current, previous):
         """Handle selection change in pending list."""
         if not current:
-            self.preview.setHtml(self._get_empty_preview_html())
+            self._preview_timer.stop()
+            self._show_empty_preview()
             return
 
         if isinstance(current, PendingPositionItem):
-            self._show_preview(current.decision)
+            # Render once the selection settles, e.g. after holding an arrow key
+            self._pending_preview_decision = current.decision
+            self._preview_timer.start()
+
+    @Slot()
+    def _render_pending_preview(self):
+        """Show the preview for the most recently selected position."""
+        if self._pending_preview_decision is not None:
+            self._show_preview(self._pending_preview_decision)
+            self._pending_preview_decision = None
 
     def _show_preview(self, decision: Decision):
         """Show preview of a decision."""
+        self._set_preview_markup(self._get_preview_svg(decision))
+
+    def _show_empty_preview(self):
+        """Show the placeholder shown when no position is selected."""
+        self._set_preview_markup(self.EMPTY_PREVIEW_MARKUP)
+
+    def _set_preview_markup(self, markup: str):
+        """Swap the preview page's content without reloading the page."""
+        self._preview_markup = markup
+        if self.preview is None:
+            if markup == self.EMPTY_PREVIEW_MARKUP:
+                return
+            self._create_preview()
+        elif self._preview_loaded:
+            self.preview.page().runJavaScript(
+                f"document.getElementById('board').innerHTML = {json.dumps(markup)};"
+            )
+
+    def _create_preview(self):
+        """Create the web view and put it in place of the placeholder label."""
+        self.preview = QWebEngineView()
+        self.preview.setContextMenuPolicy(Qt.NoContextMenu)
+        self.preview.setMinimumHeight(250)
+        self.preview.loadFinished.connect(self._on_preview_loaded)
+        self.preview.setHtml(self.PREVIEW_PAGE_HTML)
+
+        self._preview_layout.replaceWidget(self._preview_placeholder, self.preview)
+        self._preview_placeholder.deleteLater()
+        self._preview_placeholder = None
+
+    @Slot(bool)
+    def _on_preview_loaded(self, ok: bool):
+        """Apply the latest preview content once the page has loaded."""
+        self._preview_loaded = ok
+        if ok:
+            self._set_preview_markup(self._preview_markup)
+
+    def _get_preview_svg(self, decision: Decision) -> str:
+        """Get the board SVG for a decision, reusing recently rendered boards."""
+        key = None
+        if decision.xgid:
+            key = (decision.xgid, decision.dice, decision.cube_value,
+                   decision.cube_owner, decision.on_roll)
+            svg = self._preview_cache.get(key)
+            if svg is not None:
+                self._preview_cache.move_to_end(key)
+                return svg
+
         svg = self.renderer.render_svg(
             decision.position,
             dice=decision.dice,
@@ -725,68 +816,17 @@ class InputDialog(QDialog):
             score_format=self.settings.score_format,
         )
 
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                html, body {{
-                    margin: 0;
-                    padding: 0;
-                    height: 100%;
-                    overflow: hidden;
-                }}
-                body {{
-                    padding: 10px;
-                    background: #1e1e2e;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    box-sizing: border-box;
-                }}
-                svg {{
-                    max-width: 100%;
-                    max-height: 100%;
-                    height: auto;
-                }}
-            </style>
-        </head>
-        <body>
-            {svg}
-        </body>
-        </html>
-        """
-
-        self.preview.setHtml(html)
+        if key is not None:
+            self._preview_cache[key] = svg
+            if len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+        return svg
 
     def _update_count_label(self):
         """Update the pending count label."""
         count = len(self.pending_decisions)
         self.count_label.setText(f"{count} position{'s' if count != 1 else ''}")
 
-    def _get_empty_preview_html(self) -> str:
-        """Get HTML for empty preview state."""
-        return """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {
-                    margin: 0;
-                    padding: 20px;
-                    background: #1e1e2e;
-                    color: #6c7086;
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    text-align: center;
-                }
-            </style>
-        </head>
-        <body>
-            <p>Select a position to preview</p>
-        </body>
-        </html>
-        """
-
     def accept(self):
         """Handle dialog acceptance."""
         if self.pending_decisions:
@@ -6,9 +6,11 @@ Detects whether pasted text contains:
 - Full XG analysis text - ready to parse
 """
 
+import codecs
 import re
-from typing import List, Tuple
-from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from enum import Enum
 
 from ankigammon.settings import Settings
@@ -27,16 +29,52 @@ class InputFormat(Enum):
 @dataclass
 class DetectionResult:
     """Result of format detection."""
+    __slots__ = ('format', 'count', 'details', 'warnings', 'position_previews')
+
     format: InputFormat
     count: int  # Number of positions detected
     details: str  # Human-readable explanation
     warnings: List[str]  # Any warnings
-    position_previews: List[str]  # Preview text for each position
+    position_previews: List[str]  # Preview text for the first MAX_PREVIEWS positions
 
 
 class FormatDetector:
     """Detects input format from pasted text."""
 
+    # Position ID markers that start a new position block
+    _SPLIT_RE = re.compile(
+        r'(?P<xgid>XGID=[^\n]+)'
+        r'|(?P<ogid>^[0-9a-p]+:[0-9a-p]+:[A-Z0-9]{3}[^\n]*)'
+        r'|(?P<gnuid>^[A-Za-z0-9+/]{14}:[A-Za-z0-9+/]{12})',
+        re.MULTILINE,
+    )
+    _GNUID_LINE_RE = re.compile(r'[A-Za-z0-9+/]{14}:[A-Za-z0-9+/]{12}$')
+    _GNUID_BLOCK_RE = re.compile(r'[A-Za-z0-9+/=]+:[A-Za-z0-9+/=]+$')
+
+    # Checker play analysis marker (other markers are plain substrings)
+    _CHECKER_PLAY_RE = re.compile(r'\beq:', re.IGNORECASE)
+
+    # Preview extraction
+    _XGID_CAPTURE_RE = re.compile(r'XGID=([^\n]+)')
+    _PLAYER_DICE_RE = re.compile(r'([XO]) to play (\d+)')
+    MAX_PREVIEWS = 10  # Positions that get a preview; the rest are only counted
+
+    # Match file detection
+    HEADER_BYTES = 4096  # Leading bytes decoded when sniffing file headers
+    _POINT_MATCH_RE = re.compile(rb'\d+\s+point\s+match', re.IGNORECASE)
+    # One named alternative per indicator. The lookahead keeps matches
+    # zero-width, so one indicator never swallows the start of another.
+    _MATCH_INDICATORS_RE = re.compile(
+        rb'(?=(?P<point_match>point match)|(?P<game_1>Game 1)|(?P<doubles>Doubles =>)'
+        rb'|(?P<takes>Takes)|(?P<drops>Drops)|(?P<wins>Wins.*point))',
+        re.IGNORECASE,
+    )
+
+    # Position block types returned by _classify_position
+    _TYPE_UNKNOWN = 0
+    _TYPE_ID = 1
+    _TYPE_FULL = 2
+
     def __init__(self, settings: Settings):
         self.settings = settings
 
@@ -53,6 +91,19 @@ class FormatDetector:
         Returns:
             DetectionResult with format classification
         """
+        # The result only depends on the text and on GnuBG availability, so
+        # repeat detections of unchanged input are served from the cache
+        result = self._detect_text_cached(text, self.settings.is_gnubg_available())
+        return replace(
+            result,
+            warnings=list(result.warnings),
+            position_previews=list(result.position_previews)
+        )
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _detect_text_cached(cls, text: str, gnubg_ok: bool) -> DetectionResult:
+        """Detect format from input text; the returned result is shared and must not be mutated."""
         text = text.strip()
         if not text:
             return DetectionResult(
@@ -64,7 +115,7 @@ class FormatDetector:
             )
 
         # Split into potential positions
-        positions = self._split_positions(text)
+        positions = cls._split_positions(text)
 
         if not positions:
             return DetectionResult(
@@ -79,15 +130,20 @@ class FormatDetector:
         position_types = []
         previews = []
 
-        for pos_text in positions:
-            pos_type, preview = self._classify_position(pos_text)
+        for i, (pos_text, id_format) in enumerate(positions):
+            with_preview = i < cls.MAX_PREVIEWS
+            pos_type, preview = cls._classify_position(pos_text, id_format, with_preview)
             position_types.append(pos_type)
-            previews.append(preview)
+            if with_preview:
+                previews.append(preview)
 
         # Aggregate results
-        if all(pt == "position_id" for pt in position_types):
+        full_count = position_types.count(cls._TYPE_FULL)
+        id_count = position_types.count(cls._TYPE_ID)
+
+        if id_count == len(positions):
             warnings = []
-            if not self.settings.is_gnubg_available():
+            if not gnubg_ok:
                 warnings.append("GnuBG not configured - analysis required")
 
             return DetectionResult(
@@ -98,7 +154,7 @@ class FormatDetector:
                 position_previews=previews
             )
 
-        elif all(pt == "full_analysis" for pt in position_types):
+        elif full_count == len(positions):
             return DetectionResult(
                 format=InputFormat.FULL_ANALYSIS,
                 count=len(positions),
@@ -107,12 +163,9 @@ class FormatDetector:
                 position_previews=previews
             )
 
-        elif any(pt == "full_analysis" for pt in position_types) and any(pt == "position_id" for pt in position_types):
-            full_count = sum(1 for pt in position_types if pt == "full_analysis")
-            id_count = sum(1 for pt in position_types if pt == "position_id")
-
+        elif full_count and id_count:
             warnings = []
-            if id_count > 0 and not self.settings.is_gnubg_available():
+            if id_count > 0 and not gnubg_ok:
                 warnings.append(f"{id_count} position(s) need GnuBG analysis (not configured)")
 
             return DetectionResult(
@@ -183,17 +236,8 @@ class FormatDetector:
                 position_previews=["Match file - requires analysis"]
             )
 
-        try:
-            text = data.decode('utf-8', errors='ignore')
-            return self.detect(text)
-        except:
-            return DetectionResult(
-                format=InputFormat.UNKNOWN,
-                count=0,
-                details="Unknown binary format",
-                warnings=["Could not parse binary data"],
-                position_previews=[]
-            )
+        # Undecodable bytes are dropped, so any data falls back to text detection
+        return self.detect(data.decode('utf-8', errors='ignore'))
 
     def _is_xg_binary(self, data: bytes) -> bool:
         """Check if data is XG binary format (.xg file)."""
@@ -215,36 +259,37 @@ class FormatDetector:
         Returns:
             True if this is a match file
         """
-        try:
-            text = data.decode('utf-8', errors='ignore')
+        # Only the header is inspected; match files can be large
+        header = data[:FormatDetector.HEADER_BYTES]
 
-            # Strip UTF-8 BOM if present (not considered whitespace by lstrip())
-            text = text.lstrip('\ufeff').lstrip()
+        # Strip UTF-8 BOM if present (not considered whitespace by lstrip())
+        if header.startswith(codecs.BOM_UTF8):
+            header = header[len(codecs.BOM_UTF8):]
+        header = header.lstrip()
 
+        if header.startswith(b';'):
+            return True
+
+        # "N point match" is specific to backgammon — safe to scan entire
+        # file, which is searched as raw bytes to avoid decoding it all
+        if FormatDetector._POINT_MATCH_RE.search(data):
+            return True
+
+        # Leading whitespace beyond ASCII is only stripped once decoded,
+        # so decode only when the header starts with a non-ASCII byte
+        if header[:1] >= b'\x80':
+            text = header.decode('utf-8', errors='ignore').lstrip()
             if text.startswith(';'):
                 return True
 
-            # "N point match" is specific to backgammon — safe to scan entire file
-            if re.search(r'\d+\s+point\s+match', text, re.IGNORECASE):
+        # Need three different indicators in the header
+        found = set()
+        for match in FormatDetector._MATCH_INDICATORS_RE.finditer(header[:500]):
+            found.add(match.lastgroup)
+            if len(found) >= 3:
                 return True
 
-            header = text[:500]
-            match_indicators = [
-                'point match',
-                'Game 1',
-                'Doubles =>',
-                'Takes',
-                'Drops',
-                'Wins.*point'
-            ]
-
-            matches = sum(1 for indicator in match_indicators
-                         if re.search(indicator, header, re.IGNORECASE))
-
-            return matches >= 3
-
-        except:
-            return False
+        return False
 
     @staticmethod
     def is_sgf_file(data: bytes) -> bool:
@@ -259,107 +304,106 @@ class FormatDetector:
         Returns:
             True if this is an SGF backgammon file
         """
-        try:
-            text = data.decode('utf-8', errors='ignore')
+        text = data[:FormatDetector.HEADER_BYTES].decode('utf-8', errors='ignore')
 
-            if not text.lstrip().startswith('(;'):
-                return False
-
-            if 'GM[6]' not in text[:200]:
-                return False
+        if not text.lstrip().startswith('(;'):
+            return False
 
-            sgf_indicators = [
-                'FF[4]',
-                'GM[6]',
-                'PB[',
-                'PW[',
-            ]
+        if 'GM[6]' not in text[:200]:
+            return False
 
-            matches = sum(1 for indicator in sgf_indicators if indicator in text[:500])
+        sgf_indicators = [
+            'FF[4]',
+            'GM[6]',
+            'PB[',
+            'PW[',
+        ]
 
-            return matches >= 3
+        matches = sum(1 for indicator in sgf_indicators if indicator in text[:500])
 
-        except:
-            return False
+        return matches >= 3
 
-    def _split_positions(self, text: str) -> List[str]:
+    @classmethod
+    def _split_positions(cls, text: str) -> List[Tuple[str, Optional[str]]]:
         """
         Split text into individual position blocks.
 
         Separates positions by XGID/OGID/GNUID markers, keeping position IDs
         with their associated analysis content.
-        """
-        positions = []
-
-        sections = re.split(r'(XGID=[^\n]+|^[0-9a-p]+:[0-9a-p]+:[A-Z0-9]{3}[^\n]*|^[A-Za-z0-9+/]{14}:[A-Za-z0-9+/]{12})', text, flags=re.MULTILINE)
-
-        current_pos = ""
-        for i, section in enumerate(sections):
-            if (section.startswith('XGID=') or
-                re.match(r'^[0-9a-p]+:[0-9a-p]+:[A-Z0-9]{3}', section) or
-                re.match(r'^[A-Za-z0-9+/]{14}:[A-Za-z0-9+/]{12}$', section)):
-                if current_pos:
-                    positions.append(current_pos.strip())
-                current_pos = section
-            elif section.strip():
-                current_pos += "\n" + section
 
-        if current_pos:
-            positions.append(current_pos.strip())
+        Returns:
+            List of (block, id_format) tuples, where id_format is the format
+            of the marker that starts the block ("xgid", "ogid" or "gnuid"),
+            or None for text before the first marker
+        """
+        # Each marker starts a block that runs up to the next marker; any
+        # text before the first marker forms an untagged block of its own
+        starts = [(m.start(), m.lastgroup) for m in cls._SPLIT_RE.finditer(text)]
+        if not starts or starts[0][0] > 0:
+            starts.insert(0, (0, None))
+        ends = [start for start, _ in starts[1:]] + [len(text)]
 
-        if not positions:
-            lines = [line.strip() for line in text.split('\n') if line.strip()]
-            if all(self._is_position_id_line(line) for line in lines):
-                positions = lines
+        positions = []
+        for (start, id_format), end in zip(starts, ends):
+            block = text[start:end].strip()
+            if block:
+                positions.append((block, id_format))
 
         return positions
 
-    def _is_position_id_line(self, line: str) -> bool:
-        """Check if a single line is a position ID (XGID, GNUID, or OGID)."""
-        if line.startswith('XGID='):
-            return True
-
-        if re.match(r'^[0-9a-p]+:[0-9a-p]+:[A-Z0-9]{3}', line):
-            return True
-
-        if re.match(r'^[A-Za-z0-9+/]{14}:[A-Za-z0-9+/]{12}$', line):
-            return True
-
-        return False
-
-    def _classify_position(self, text: str) -> Tuple[str, str]:
+    @classmethod
+    def _classify_position(cls, text: str, id_format: Optional[str],
+                           with_preview: bool = True) -> Tuple[int, Optional[str]]:
         """
         Classify a single position block as position ID, full analysis, or unknown.
 
+        Args:
+            text: Position block, with surrounding whitespace already stripped
+            id_format: Format of the block's leading position ID, from _split_positions
+            with_preview: Whether to build the preview text
+
         Returns:
-            (type, preview) tuple
+            (type, preview) tuple, where type is one of the _TYPE_* constants
+            and preview is None unless requested
         """
         has_xgid = 'XGID=' in text
-        has_ogid = bool(re.match(r'^[0-9a-p]+:[0-9a-p]+:[A-Z0-9]{3}', text.strip()))
-        has_gnuid = bool(re.match(r'^[A-Za-z0-9+/=]+:[A-Za-z0-9+/=]+$', text.strip()))
+        has_ogid = id_format == "ogid"
+        # A GNUID block only counts when it holds nothing but the ID; untagged
+        # blocks get the looser check since no marker was found in them
+        if id_format == "gnuid":
+            has_gnuid = bool(cls._GNUID_LINE_RE.match(text))
+        else:
+            has_gnuid = id_format is None and bool(cls._GNUID_BLOCK_RE.match(text))
 
-        has_checker_play = bool(re.search(r'\beq:', text, re.IGNORECASE))
-        has_cube_decision = bool(re.search(r'Cubeful Equities:|Proper cube action:', text, re.IGNORECASE))
-        has_board = bool(re.search(r'\+13-14-15-16-17-18', text))
+        # Plain substring checks first; the regex is only needed for the
+        # word boundary before "eq:"
+        lowered = text.lower()
+        has_checker_play = 'eq:' in lowered and bool(cls._CHECKER_PLAY_RE.search(text))
+        has_cube_decision = 'cubeful equities:' in lowered or 'proper cube action:' in lowered
+        has_board = '+13-14-15-16-17-18' in text
 
-        preview = self._extract_preview(text, has_xgid, has_ogid, has_gnuid)
+        preview = None
+        if with_preview:
+            xgid_match = cls._XGID_CAPTURE_RE.search(text) if has_xgid else None
+            preview = cls._extract_preview(text, has_xgid, xgid_match, has_ogid, has_gnuid)
 
         if (has_xgid or has_ogid or has_gnuid):
             if has_checker_play or has_cube_decision or has_board:
-                return ("full_analysis", preview)
+                return (cls._TYPE_FULL, preview)
             else:
-                return ("position_id", preview)
+                return (cls._TYPE_ID, preview)
 
-        return ("unknown", preview)
+        return (cls._TYPE_UNKNOWN, preview)
 
-    def _extract_preview(self, text: str, has_xgid: bool, has_ogid: bool, has_gnuid: bool) -> str:
-        """Extract a short preview of the position."""
+    @classmethod
+    def _extract_preview(cls, text: str, has_xgid: bool, xgid_match: Optional[re.Match],
+                         has_ogid: bool, has_gnuid: bool) -> str:
+        """Extract a short preview of the position, reusing the XGID match from classification."""
         if has_xgid:
-            match = re.search(r'XGID=([^\n]+)', text)
-            if match:
-                xgid = match.group(1)[:50]
+            if xgid_match:
+                xgid = xgid_match.group(1)[:50]
 
-                player_match = re.search(r'([XO]) to play (\d+)', text)
+                player_match = cls._PLAYER_DICE_RE.search(text)
                 if player_match:
                     player = player_match.group(1)
                     dice = player_match.group(2)
@@ -368,7 +412,7 @@ class FormatDetector:
                 return f"XGID={xgid}..."
 
         elif has_ogid:
-            parts = text.strip().split(':')
+            parts = text.split(':')
             if len(parts) >= 5:
                 dice = parts[3] if len(parts) > 3 and parts[3] else "to roll"
                 turn = parts[4] if len(parts) > 4 and parts[4] else ""
@@ -10,9 +10,11 @@ from PySide6.QtCore import Qt, Signal, Slot, QUrl, QSettings, QSize, QThread, QT
 from PySide6.QtGui import QAction, QKeySequence, QDesktopServices
 from PySide6.QtWebEngineWidgets import QWebEngineView
 import qtawesome as qta
-import base64
+import binascii
 import subprocess
 import sys
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from ankigammon import __version__
@@ -30,6 +32,109 @@ from ankigammon.gui import silent_messagebox
 from ankigammon.utils.subprocess_env import external_subprocess_env
 
 
+@lru_cache(maxsize=1)
+def _welcome_html() -> str:
+    """Build the preview pane's welcome page, reading the app icon only once."""
+    # Load icon and convert to base64 for embedding in HTML
+    icon_path = get_resource_path("ankigammon/gui/resources/icon.png")
+    icon_data_url = ""
+    if icon_path.exists():
+        with open(icon_path, "rb") as f:
+            icon_bytes = f.read()
+            icon_b64 = binascii.b2a_base64(icon_bytes, newline=False).decode('ascii')
+            icon_data_url = f"data:image/png;base64,{icon_b64}"
+
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <style>
+            body {{
+                margin: 0;
+                padding: 0;
+                display: flex;
+                flex-direction: column;
+                justify-content: center;
+                align-items: center;
+                min-height: 100vh;
+                background: linear-gradient(135deg, #1e1e2e 0%, #181825 100%);
+                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                color: #cdd6f4;
+            }}
+            .welcome {{
+                text-align: center;
+                padding: 40px;
+            }}
+            h1 {{
+                color: #f5e0dc;
+                font-size: 32px;
+                margin-bottom: 16px;
+                font-weight: 700;
+            }}
+            p {{
+                color: #a6adc8;
+                font-size: 16px;
+                margin: 8px 0;
+            }}
+            .icon {{
+                margin-bottom: 24px;
+                opacity: 0.6;
+            }}
+            .icon img {{
+                width: 140px;
+                height: auto;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="welcome">
+            <div class="icon">
+                <img src="{icon_data_url}" alt="AnkiGammon Icon" />
+            </div>
+            <h1>No Position Loaded</h1>
+            <p>Add positions to get started</p>
+        </div>
+    </body>
+    </html>
+    """
+
+
+# Preview page for a decision; formatted with the rendered board as {svg}
+_DECISION_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        html, body {{
+            margin: 0;
+            padding: 0;
+            height: 100%;
+            overflow: hidden;
+        }}
+        body {{
+            padding: 20px;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            background: linear-gradient(135deg, #1e1e2e 0%, #181825 100%);
+            box-sizing: border-box;
+        }}
+        svg {{
+            max-width: 100%;
+            max-height: 100%;
+            height: auto;
+            filter: drop-shadow(0 10px 30px rgba(0, 0, 0, 0.5));
+            border-radius: 12px;
+        }}
+    </style>
+</head>
+<body>
+    {svg}
+</body>
+</html>
+"""
+
+
 class MatchAnalysisWorker(QThread):
     """
     Background thread for GnuBG match file analysis.
@@ -147,6 +252,8 @@ class MainWindow(QMainWindow):
     # Signals
     decisions_parsed = Signal(list)  # List[Decision]
 
+    PREVIEW_CACHE_SIZE = 64  # Preview pages kept for recently shown decisions
+
     def __init__(self, settings: Settings):
         super().__init__()
         self.settings = settings
@@ -178,6 +285,9 @@ class MainWindow(QMainWindow):
         self._drag_expand_timer.timeout.connect(self._on_drag_expand_timeout)
         self._version_checker_thread = None  # Version checker thread
         self._deck_sync_thread = None  # Deck sync thread
+        self._preview_state: Optional[str] = None  # "welcome" or "decision" once the preview has loaded a page
+        # Preview pages keyed by id(decision); each entry keeps its decision alive so ids stay unique
+        self._preview_cache: "OrderedDict[int, Tuple[Decision, str]]" = OrderedDict()
 
         # Enable drag and drop
         self.setAcceptDrops(True)
@@ -221,77 +331,17 @@ class MainWindow(QMainWindow):
         left_panel.setAcceptDrops(False)  # Let drag events propagate to main window
         layout.addWidget(left_panel, stretch=1)
 
-        # Right panel: Preview
-        self.preview = QWebEngineView()
-        self.preview.setContextMenuPolicy(Qt.NoContextMenu)  # Disable browser context menu
-        self.preview.setAcceptDrops(False)  # Let drag events propagate to main window
+        # Right panel: Preview, held by a plain placeholder until first use
+        self.preview: Optional[QWebEngineView] = None
+        self._preview_layout = layout
+        self._preview_placeholder = QWidget()
+        self._preview_placeholder.setAcceptDrops(False)  # Let drag events propagate to main window
+        layout.addWidget(self._preview_placeholder, stretch=2)
 
-        # Load icon and convert to base64 for embedding in HTML
-        icon_path = get_resource_path("ankigammon/gui/resources/icon.png")
-        icon_data_url = ""
-        if icon_path.exists():
-            with open(icon_path, "rb") as f:
-                icon_bytes = f.read()
-                icon_b64 = base64.b64encode(icon_bytes).decode('utf-8')
-                icon_data_url = f"data:image/png;base64,{icon_b64}"
-
-        self.welcome_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{
-                    margin: 0;
-                    padding: 0;
-                    display: flex;
-                    flex-direction: column;
-                    justify-content: center;
-                    align-items: center;
-                    min-height: 100vh;
-                    background: linear-gradient(135deg, #1e1e2e 0%, #181825 100%);
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    color: #cdd6f4;
-                }}
-                .welcome {{
-                    text-align: center;
-                    padding: 40px;
-                }}
-                h1 {{
-                    color: #f5e0dc;
-                    font-size: 32px;
-                    margin-bottom: 16px;
-                    font-weight: 700;
-                }}
-                p {{
-                    color: #a6adc8;
-                    font-size: 16px;
-                    margin: 8px 0;
-                }}
-                .icon {{
-                    margin-bottom: 24px;
-                    opacity: 0.6;
-                }}
-                .icon img {{
-                    width: 140px;
-                    height: auto;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="welcome">
-                <div class="icon">
-                    <img src="{icon_data_url}" alt="AnkiGammon Icon" />
-                </div>
-                <h1>No Position Loaded</h1>
-                <p>Add positions to get started</p>
-            </div>
-        </body>
-        </html>
-        """
-        # Defer setHtml until after the window paints — Chromium subprocess
-        # spawn (~500ms) would otherwise block first paint of the main window.
-        QTimer.singleShot(0, lambda: self.preview.setHtml(self.welcome_html))
-        layout.addWidget(self.preview, stretch=2)
+        # Defer the web view until after the window paints — creating it and
+        # spawning the Chromium subprocess (~500ms) would otherwise block
+        # first paint of the main window.
+        QTimer.singleShot(0, self._show_welcome)
 
         # Status bar
         self.statusBar().showMessage("Ready")
@@ -536,18 +586,20 @@ class MainWindow(QMainWindow):
         """Connect signals and slots."""
         self.decisions_parsed.connect(self.on_decisions_loaded)
 
+    @Slot()
     def _on_new_deck_clicked(self):
         """Handle New Deck button click."""
         self.deck_tree.create_new_deck_dialog()
 
+    @Slot()
     def _on_positions_changed(self):
         """Handle position changes (add/remove/move) from deck tree."""
         has_positions = not self.deck_manager.is_empty
         self.btn_export.setEnabled(has_positions)
         if not has_positions:
-            self.preview.setHtml(self.welcome_html)
-            self.preview.update()
+            self._show_welcome()
 
+    @Slot()
     def _on_deck_structure_changed(self):
         """Handle deck create/rename/delete — save deck names to settings."""
         self.settings.saved_deck_names = self.deck_manager.get_deck_names()
@@ -710,8 +762,7 @@ class MainWindow(QMainWindow):
         """Update UI state when positions may have changed."""
         if self.deck_manager.is_empty:
             self.btn_export.setEnabled(False)
-            self.preview.setHtml(self.welcome_html)
-            self.preview.update()
+            self._show_welcome()
 
     @Slot()
     def on_clear_all_clicked(self):
@@ -734,9 +785,7 @@ class MainWindow(QMainWindow):
             self.deck_tree.rebuild_tree()
             self.btn_export.setEnabled(False)
 
-            # Show welcome screen
-            self.preview.setHtml(self.welcome_html)
-            self.preview.update()  # Force repaint to avoid black screen issue
+            self._show_welcome()
 
     @Slot(list)
     def on_decisions_loaded(self, decisions):
@@ -748,8 +797,48 @@ class MainWindow(QMainWindow):
         # Update deck tree
         self.deck_tree.rebuild_tree()
 
+    def _show_welcome(self):
+        """Show the welcome screen in the preview pane, unless it is already shown."""
+        # Only shown once the positions are gone, so their pages can go too
+        self._preview_cache.clear()
+        if self._preview_state == "welcome":
+            return
+        self._preview_state = "welcome"
+        self._set_preview_html(_welcome_html())
+
+    @Slot(Decision)
     def show_decision(self, decision: Decision):
         """Display a decision in the preview pane."""
+        html = self._get_decision_html(decision)
+
+        self._preview_state = "decision"
+        self._set_preview_html(html)
+
+    def _set_preview_html(self, html: str):
+        """Load a page into the preview pane, creating the web view on first use."""
+        if self.preview is None:
+            self._create_preview()
+        self.preview.setHtml(html)
+        self.preview.update()  # Force repaint to avoid black screen issue
+
+    def _create_preview(self):
+        """Create the web view and put it in place of the placeholder."""
+        self.preview = QWebEngineView()
+        self.preview.setContextMenuPolicy(Qt.NoContextMenu)  # Disable browser context menu
+        self.preview.setAcceptDrops(False)  # Let drag events propagate to main window
+
+        self._preview_layout.replaceWidget(self._preview_placeholder, self.preview)
+        self._preview_placeholder.deleteLater()
+        self._preview_placeholder = None
+
+    def _get_decision_html(self, decision: Decision) -> str:
+        """Get the preview page for a decision, reusing recently shown pages."""
+        key = id(decision)
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            self._preview_cache.move_to_end(key)
+            return cached[1]
+
         # Mirror the split-cube variant rendering in CardGenerator.generate_card
         # so the preview matches what the exported Anki card will look like.
         from ankigammon.models import DecisionType, Player, CubeState
@@ -798,42 +887,12 @@ class MainWindow(QMainWindow):
         )
 
         # Wrap SVG in minimal HTML with dark theme
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                html, body {{
-                    margin: 0;
-                    padding: 0;
-                    height: 100%;
-                    overflow: hidden;
-                }}
-                body {{
-                    padding: 20px;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    background: linear-gradient(135deg, #1e1e2e 0%, #181825 100%);
-                    box-sizing: border-box;
-                }}
-                svg {{
-                    max-width: 100%;
-                    max-height: 100%;
-                    height: auto;
-                    filter: drop-shadow(0 10px 30px rgba(0, 0, 0, 0.5));
-                    border-radius: 12px;
-                }}
-            </style>
-        </head>
-        <body>
-            {svg}
-        </body>
-        </html>
-        """
+        html = _DECISION_HTML.format(svg=svg)
 
-        self.preview.setHtml(html)
-        self.preview.update()  # Force repaint to avoid black screen issue
+        self._preview_cache[key] = (decision, html)
+        if len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        return html
 
     @Slot()
     def on_settings_clicked(self):
@@ -845,6 +904,9 @@ class MainWindow(QMainWindow):
     @Slot(Settings)
     def on_settings_changed(self, settings: Settings):
         """Handle settings changes."""
+        # Cached previews were rendered with the old scheme and options
+        self._preview_cache.clear()
+
         # Update renderer with new color scheme and orientation
         scheme = get_scheme(settings.color_scheme)
         if settings.swap_checker_colors:
@@ -906,9 +968,7 @@ class MainWindow(QMainWindow):
         self.deck_tree.rebuild_tree()
         self.btn_export.setEnabled(False)
 
-        # Show welcome screen
-        self.preview.setHtml(self.welcome_html)
-        self.preview.update()  # Force repaint to avoid black screen issue
+        self._show_welcome()
 
     @Slot(str)
     def change_color_scheme(self, scheme: str):
@@ -1608,6 +1668,7 @@ class MainWindow(QMainWindow):
 
         event.acceptProposedAction()
 
+    @Slot()
     def _on_drag_expand_timeout(self):
         """Expand the deck item currently being hovered during a file drag."""
         if self._file_drag_deck_item and not self._file_drag_deck_item.isExpanded():
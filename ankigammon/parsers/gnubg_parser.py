@@ -14,6 +14,62 @@ from ankigammon.utils.xgid import parse_xgid
 class GNUBGParser:
     """Parse GNU Backgammon analysis output."""
 
+    # Patterns are compiled once here; the score matrix parses dozens of
+    # hint blocks per card. All support European locale decimal commas.
+
+    # Checker play move line, e.g.
+    #   "    1. Cubeful 4-ply    21/16 21/15                  Eq.:  -0.411"
+    #   "    2. Cubeful 4-ply    9/4 9/3                      Eq.:  -0.437 ( -0.025)"
+    # The "Cubeful N-ply" prefix is captured in its own group so we can
+    # surface the ply count as Move.analysis_level — matches the
+    # behavior of the match-file parser.
+    _MOVE_RE = re.compile(
+        r'^\s*(\d+)\.\s+(?:Cubeful\s+(\d+)-ply\s+)?(.*?)\s+Eq\.?:\s*([+-]?\d+[.,]\d+)(?:\s*\(\s*([+-]?\d+[.,]\d+)\))?',
+        re.IGNORECASE
+    )
+
+    # Probability line anchored at line start, e.g.
+    #   "       0.266 0.021 0.001 - 0.734 0.048 0.001"
+    _MOVE_PROB_RE = re.compile(
+        r'^\s*(\d[.,]\d+)\s+(\d[.,]\d+)\s+(\d[.,]\d+)\s*-\s*(\d[.,]\d+)\s+(\d[.,]\d+)\s+(\d[.,]\d+)'
+    )
+
+    # Fallback move line without rank numbers
+    _ALT_MOVE_RE = re.compile(
+        r'^\s*([0-9/\s*bar]+?)\s+Eq:\s*([+-]?\d+[.,]\d+)',
+        re.MULTILINE
+    )
+
+    # Cube decision lines, e.g.
+    #   "1. No double           +0.172"
+    #   "2. Double, take        -0.361  (-0.533)"
+    #   "3. Double, pass        +1.000  (+0.828)"
+    _CUBE_EQUITY_RE = re.compile(
+        r'^\s*\d+\.\s*(No (?:re)?double|(?:Re)?[Dd]ouble,?\s*(?:take|pass|drop))\s*([+-]?\d+[.,]\d+)(?:\s*\(([+-]\d+[.,]\d+)\))?',
+        re.MULTILINE | re.IGNORECASE
+    )
+
+    _PROPER_CUBE_ACTION_RE = re.compile(
+        r'Proper cube action:\s*(.+?)(?:\n|$)', re.IGNORECASE
+    )
+
+    # "Cubeless equity: +0.172" or "1-ply cubeless equity -0.008 (Money: -0.008)"
+    _CUBELESS_EQUITY_RE = re.compile(
+        r'(?:Cubeless equity:|cubeless equity)\s*([+-]?\d+[.,]\d+)',
+        re.IGNORECASE
+    )
+
+    # "Win: 52.3%  G: 14.2%  B: 0.8%"
+    _WIN_PCT_RE = re.compile(
+        r'Win:\s*(\d+[.,]?\d*)%.*?G:\s*(\d+[.,]?\d*)%.*?B:\s*(\d+[.,]?\d*)%',
+        re.IGNORECASE
+    )
+
+    # Decimal probabilities anywhere in the text, e.g. "0.523 0.142 0.008 - 0.477 0.124 0.006"
+    _PROB_RE = re.compile(
+        r'(\d[.,]\d+)\s+(\d[.,]\d+)\s+(\d[.,]\d+)\s*-\s*(\d[.,]\d+)\s+(\d[.,]\d+)\s+(\d[.,]\d+)'
+    )
+
     @staticmethod
     def _parse_locale_float(s: str) -> float:
         """Parse a float string that may use comma or period as decimal separator."""
@@ -82,9 +138,7 @@ class GNUBGParser:
 
         # Detect beaverable cube actions from gnubg's "Proper cube action:" line.
         if decision_type == DecisionType.CUBE_ACTION:
-            proper_match = re.search(
-                r'Proper cube action:\s*(.+?)(?:\n|$)', gnubg_output, re.IGNORECASE
-            )
+            proper_match = GNUBGParser._PROPER_CUBE_ACTION_RE.search(gnubg_output)
             if proper_match and "beaver" in proper_match.group(1).lower():
                 decision.beaverable = True
 
@@ -120,22 +174,8 @@ class GNUBGParser:
         moves = []
         lines = text.split('\n')
 
-        # Pattern for gnubg move lines (supports European locale with comma decimal separator)
-        # Matches: "    1. Cubeful 4-ply    21/16 21/15                  Eq.:  -0.411"
-        #          "    2. Cubeful 4-ply    9/4 9/3                      Eq.:  -0.437 ( -0.025)"
-        # Captures the "Cubeful N-ply" prefix in its own group so we can
-        # surface the ply count as Move.analysis_level — matches the
-        # behavior of the match-file parser.
-        move_pattern = re.compile(
-            r'^\s*(\d+)\.\s+(?:Cubeful\s+(\d+)-ply\s+)?(.*?)\s+Eq\.?:\s*([+-]?\d+[.,]\d+)(?:\s*\(\s*([+-]?\d+[.,]\d+)\))?',
-            re.IGNORECASE
-        )
-
-        # Pattern for probability line (supports European locale with comma decimal separator)
-        # Matches: "       0.266 0.021 0.001 - 0.734 0.048 0.001" or "       0,266 0,021 0,001 - 0,734 0,048 0,001"
-        prob_pattern = re.compile(
-            r'^\s*(\d[.,]\d+)\s+(\d[.,]\d+)\s+(\d[.,]\d+)\s*-\s*(\d[.,]\d+)\s+(\d[.,]\d+)\s+(\d[.,]\d+)'
-        )
+        move_pattern = GNUBGParser._MOVE_RE
+        prob_pattern = GNUBGParser._MOVE_PROB_RE
 
         for i, line in enumerate(lines):
             match = move_pattern.match(line)
@@ -196,11 +236,7 @@ class GNUBGParser:
         # If no moves found, try alternative pattern
         if not moves:
             # Try simpler pattern without rank numbers (supports European locale)
-            alt_pattern = re.compile(
-                r'^\s*([0-9/\s*bar]+?)\s+Eq:\s*([+-]?\d+[.,]\d+)',
-                re.MULTILINE
-            )
-            for i, match in enumerate(alt_pattern.finditer(text), 1):
+            for i, match in enumerate(GNUBGParser._ALT_MOVE_RE.finditer(text), 1):
                 notation = match.group(1).strip()
                 equity = GNUBGParser._parse_locale_float(match.group(2))
 
@@ -273,19 +309,9 @@ class GNUBGParser:
         if 'Cubeful equities' not in text and 'cubeful equities' not in text:
             return moves
 
-        # Parse the 3 equity values from gnubg (supports European locale with comma)
-        # Pattern to match cube decision lines:
-        # "1. No double           +0.172" or "1. No double           +0,172"
-        # "2. Double, take        -0.361  (-0.533)"
-        # "3. Double, pass        +1.000  (+0.828)"
-        pattern = re.compile(
-            r'^\s*\d+\.\s*(No (?:re)?double|(?:Re)?[Dd]ouble,?\s*(?:take|pass|drop))\s*([+-]?\d+[.,]\d+)(?:\s*\(([+-]\d+[.,]\d+)\))?',
-            re.MULTILINE | re.IGNORECASE
-        )
-
-        # Store parsed equities in order they appear
+        # Parse the 3 equity values from gnubg, in the order they appear
         gnubg_moves_data = []  # List of (normalized_notation, equity, gnubg_error)
-        for match in pattern.finditer(text):
+        for match in GNUBGParser._CUBE_EQUITY_RE.finditer(text):
             notation = match.group(1).strip()
             equity = GNUBGParser._parse_locale_float(match.group(2))
             error_str = match.group(3)
@@ -304,11 +330,7 @@ class GNUBGParser:
         equity_map = {data[0]: data[1] for data in gnubg_moves_data}
 
         # Parse "Proper cube action:" to determine best move
-        best_action_match = re.search(
-            r'Proper cube action:\s*(.+?)(?:\n|$)',
-            text,
-            re.IGNORECASE
-        )
+        best_action_match = GNUBGParser._PROPER_CUBE_ACTION_RE.search(text)
 
         best_action_text = None
         if best_action_match:
@@ -482,30 +504,19 @@ class GNUBGParser:
 
         # Extract cubeless equity from patterns like:
         # "Cubeless equity: +0.172" or "1-ply cubeless equity -0.008 (Money: -0.008)"
-        cubeless_pattern = re.search(
-            r'(?:Cubeless equity:|cubeless equity)\s*([+-]?\d+[.,]\d+)',
-            text,
-            re.IGNORECASE
-        )
+        cubeless_pattern = GNUBGParser._CUBELESS_EQUITY_RE.search(text)
         if cubeless_pattern:
             chances['cubeless_equity'] = GNUBGParser._parse_locale_float(cubeless_pattern.group(1))
 
         # Try pattern 1: "Win: 52.3%  G: 14.2%  B: 0.8%" or "Win: 52,3%  G: 14,2%  B: 0,8%" (European locale)
-        win_pattern = re.search(
-            r'Win:\s*(\d+[.,]?\d*)%.*?G:\s*(\d+[.,]?\d*)%.*?B:\s*(\d+[.,]?\d*)%',
-            text,
-            re.IGNORECASE
-        )
+        win_pattern = GNUBGParser._WIN_PCT_RE.search(text)
         if win_pattern:
             chances['player_win_pct'] = GNUBGParser._parse_locale_float(win_pattern.group(1))
             chances['player_gammon_pct'] = GNUBGParser._parse_locale_float(win_pattern.group(2))
             chances['player_backgammon_pct'] = GNUBGParser._parse_locale_float(win_pattern.group(3))
 
         # Try pattern 2: Decimal probabilities "0.523 0.142 0.008 - 0.477 0.124 0.006" (supports European locale)
-        prob_pattern = re.search(
-            r'(\d[.,]\d+)\s+(\d[.,]\d+)\s+(\d[.,]\d+)\s*-\s*(\d[.,]\d+)\s+(\d[.,]\d+)\s+(\d[.,]\d+)',
-            text
-        )
+        prob_pattern = GNUBGParser._PROB_RE.search(text)
         if prob_pattern:
             chances['player_win_pct'] = GNUBGParser._parse_locale_float(prob_pattern.group(1)) * 100
             chances['player_gammon_pct'] = GNUBGParser._parse_locale_float(prob_pattern.group(2)) * 100
@@ -64,6 +64,35 @@ class BackgammonAnalyzer(ABC):
             List of (raw analysis text, decision type) tuples
         """
 
+    def analyze_positions_batch(
+        self,
+        position_ids: List[str],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_callback: Optional[Callable[[], bool]] = None
+    ) -> List[Tuple[str, DecisionType]]:
+        """Analyze multiple positions in a single engine session.
+
+        Engines that can amortize startup across positions override this.
+        The default delegates to analyze_positions_parallel().
+
+        Args:
+            position_ids: List of XGID/GNUID strings
+            progress_callback: Called with (completed, total)
+            cancellation_callback: Returns True to cancel
+
+        Returns:
+            List of (raw analysis text, decision type) tuples
+
+        Raises:
+            RuntimeError: If the batch session fails; callers may fall back
+                to analyze_positions_parallel()
+        """
+        return self.analyze_positions_parallel(
+            position_ids,
+            progress_callback=progress_callback,
+            cancellation_callback=cancellation_callback
+        )
+
     @abstractmethod
     def parse_analysis(
         self,
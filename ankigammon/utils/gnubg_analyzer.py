@@ -5,21 +5,34 @@ Provides functionality to analyze backgammon positions using gnubg-cli.exe.
 Implements the BackgammonAnalyzer interface for use as a pluggable analysis engine.
 """
 
+import logging
 import os
 import sys
 import re
 import subprocess
 import tempfile
+import threading
+import time
 import multiprocessing
 from pathlib import Path
 from typing import Tuple, List, Callable, Optional
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ankigammon.models import Decision, DecisionType, Move
 from ankigammon.utils.xgid import parse_xgid
 from ankigammon.utils.analyzer_base import BackgammonAnalyzer
 from ankigammon.utils.subprocess_env import external_subprocess_env
 
+logger = logging.getLogger(__name__)
+
+# Marker printed (via gnubg's embedded Python shell) between positions in a
+# batched session so the combined stdout can be split back per position.
+_BATCH_SENTINEL = "===ANKIGAMMON POSITION "
+
+# Seconds gnubg may spend on one position, as for a single-position run.
+# A batched session is killed once a position exceeds it.
+_POSITION_TIMEOUT = 120
+
 
 class GNUBGAnalyzer(BackgammonAnalyzer):
     """Wrapper for gnubg-cli.exe command-line interface."""
@@ -120,15 +133,16 @@ class GNUBGAnalyzer(BackgammonAnalyzer):
                     progress_callback(i + 1, len(position_ids))
             return results
 
-        args_list = [(self.gnubg_path, self.analysis_ply, pos_id) for pos_id in position_ids]
         results = [None] * len(position_ids)
         completed = 0
 
-        executor = ProcessPoolExecutor(max_workers=max_workers)
+        # The work happens in the gnubg child processes; a thread only waits
+        # on its pipe, so threads are enough and avoid spawning interpreters
+        executor = ThreadPoolExecutor(max_workers=max_workers)
         try:
             future_to_idx = {
-                executor.submit(_analyze_position_worker, *args): idx
-                for idx, args in enumerate(args_list)
+                executor.submit(self.analyze_position, pos_id): idx
+                for idx, pos_id in enumerate(position_ids)
             }
 
             for future in as_completed(future_to_idx):
@@ -159,6 +173,168 @@ class GNUBGAnalyzer(BackgammonAnalyzer):
 
         return results
 
+    def analyze_positions_batch(
+        self,
+        position_ids: List[str],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancellation_callback: Optional[Callable[[], bool]] = None
+    ) -> List[Tuple[str, DecisionType]]:
+        """
+        Analyze multiple positions in a single gnubg-cli session.
+
+        All positions are scripted into one command file (``set xgid`` +
+        ``hint`` per position), so process startup and weight loading are
+        paid once rather than once per position. A sentinel line is printed
+        before each position so the combined output can be split back into
+        per-position hint blocks.
+
+        Args:
+            position_ids: List of position identifiers (XGID or GNUID format)
+            progress_callback: Optional callback for progress updates: callback(completed, total)
+            cancellation_callback: Optional callback that returns True if cancelled
+
+        Returns:
+            List of tuples (gnubg_output_text, decision_type) in same order as position_ids
+
+        Raises:
+            ValueError: If any position_id format is invalid
+            RuntimeError: If gnubg fails, stalls on a position for longer than
+                the per-position timeout, or its output cannot be split per
+                position (e.g. a build without Python support). Callers should
+                fall back to analyze_positions_parallel().
+            InterruptedError: If cancellation is requested
+        """
+        if not position_ids:
+            return []
+
+        total = len(position_ids)
+        decision_types = [self._determine_decision_type(pos_id) for pos_id in position_ids]
+
+        commands = [
+            "set automatic game off",
+            "set automatic roll off",
+            f"set analysis chequerplay evaluation plies {self.analysis_ply}",
+            f"set analysis cubedecision evaluation plies {self.analysis_ply}",
+            "set output matchpc off",
+        ]
+        for idx, pos_id in enumerate(position_ids):
+            commands.append(f'>print("{_BATCH_SENTINEL}{idx}")')
+            commands.append(self._set_position_command(pos_id))
+            commands.append("hint")
+
+        command_file = self._create_command_file_from_list(commands)
+
+        blocks: List[List[str]] = [[] for _ in position_ids]
+        current = None
+
+        try:
+            # stderr goes to a file so warnings stay out of the hint blocks
+            # and a full stderr pipe cannot stall the session
+            stderr_file = tempfile.TemporaryFile()
+            kwargs = {
+                'stdout': subprocess.PIPE,
+                'stderr': stderr_file,
+                'text': True,
+                'env': external_subprocess_env(),
+            }
+            if sys.platform == 'win32':
+                kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+            process = subprocess.Popen(
+                [self.gnubg_path, "-t", "-q", "-c", command_file],
+                **kwargs
+            )
+            self._current_process = process
+
+            # The watchdog kills gnubg when a position runs past its timeout
+            # or the user cancels, since reading stdout blocks until then
+            deadline = time.monotonic() + _POSITION_TIMEOUT
+            stop_watchdog = threading.Event()
+            stopped_by = None
+
+            def watchdog():
+                nonlocal stopped_by
+                while not stop_watchdog.wait(0.2):
+                    if cancellation_callback and cancellation_callback():
+                        stopped_by = "cancelled"
+                    elif time.monotonic() > deadline:
+                        stopped_by = "timeout"
+                    else:
+                        continue
+                    process.kill()
+                    return
+
+            watchdog_thread = threading.Thread(target=watchdog, daemon=True)
+            watchdog_thread.start()
+
+            try:
+                for line in process.stdout:
+                    stripped = line.strip()
+                    if stripped.startswith(_BATCH_SENTINEL):
+                        if cancellation_callback and cancellation_callback():
+                            process.kill()
+                            raise InterruptedError("Analysis cancelled by user")
+
+                        try:
+                            idx = int(stripped[len(_BATCH_SENTINEL):])
+                        except ValueError:
+                            idx = -1
+                        if not 0 <= idx < total:
+                            raise RuntimeError(f"Unexpected batch sentinel in GnuBG output: {stripped}")
+
+                        current = idx
+                        deadline = time.monotonic() + _POSITION_TIMEOUT
+                        if progress_callback:
+                            progress_callback(idx, total)
+                        continue
+
+                    if current is not None:
+                        blocks[current].append(line)
+
+                returncode = process.wait()
+            finally:
+                stop_watchdog.set()
+                watchdog_thread.join()
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                self._current_process = None
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode('utf-8', errors='replace').strip()
+                stderr_file.close()
+
+            if stopped_by == "cancelled":
+                raise InterruptedError("Analysis cancelled by user")
+            if stopped_by == "timeout":
+                stalled = 1 if current is None else current + 1
+                raise RuntimeError(
+                    f"GnuBG batch analysis timed out on position {stalled} of {total} "
+                    f"(no progress for {_POSITION_TIMEOUT}s)"
+                )
+            if stderr:
+                logger.debug("GnuBG batch stderr: %s", stderr)
+            if returncode != 0:
+                raise RuntimeError(
+                    f"GnuBG batch analysis exited with code {returncode}"
+                    + (f": {stderr}" if stderr else "")
+                )
+            if current != total - 1:
+                raise RuntimeError(
+                    f"GnuBG batch output could not be split per position "
+                    f"(reached {0 if current is None else current + 1} of {total})"
+                )
+        finally:
+            try:
+                os.unlink(command_file)
+            except OSError:
+                pass
+
+        if progress_callback:
+            progress_callback(total, total)
+
+        logger.debug("GnuBG batch analysis complete: %d positions", total)
+        return [(''.join(block), dt) for block, dt in zip(blocks, decision_types)]
+
     def analyze_match_file(
         self,
         mat_file_path: str,
@@ -446,6 +622,24 @@ class GNUBGAnalyzer(BackgammonAnalyzer):
         else:
             return DecisionType.CHECKER_PLAY
 
+    @staticmethod
+    def _set_position_command(position_id: str) -> str:
+        """
+        Build the gnubg command that loads a position.
+
+        Args:
+            position_id: XGID or GNUID string
+
+        Returns:
+            "set xgid ..." or "set gnubgid ..." command
+        """
+        if position_id.startswith("XGID="):
+            return f"set xgid {position_id}"
+        elif ":" in position_id:
+            return f"set xgid XGID={position_id}"
+        else:
+            return f"set gnubgid {position_id}"
+
     def _create_command_file(self, position_id: str, decision_type: DecisionType) -> str:
         """
         Create a temporary command file for gnubg.
@@ -457,17 +651,10 @@ class GNUBGAnalyzer(BackgammonAnalyzer):
         Returns:
             Path to temporary command file
         """
-        if position_id.startswith("XGID="):
-            set_command = f"set xgid {position_id}"
-        elif ":" in position_id and not position_id.startswith("XGID="):
-            set_command = f"set xgid XGID={position_id}"
-        else:
-            set_command = f"set gnubgid {position_id}"
-
         commands = [
             "set automatic game off",
             "set automatic roll off",
-            set_command,
+            self._set_position_command(position_id),
             f"set analysis chequerplay evaluation plies {self.analysis_ply}",
             f"set analysis cubedecision evaluation plies {self.analysis_ply}",
             "set output matchpc off",
@@ -657,21 +844,3 @@ class GNUBGAnalyzer(BackgammonAnalyzer):
         """Parse cube decision moves from GnuBG output."""
         from ankigammon.parsers.gnubg_parser import GNUBGParser
         return GNUBGParser._parse_cube_decision(raw_output, cube_value)
-
-
-def _analyze_position_worker(gnubg_path: str, analysis_ply: int, position_id: str) -> Tuple[str, DecisionType]:
-    """
-    Worker function for parallel position analysis.
-
-    This is a module-level function to support pickling for multiprocessing.
-
-    Args:
-        gnubg_path: Path to gnubg-cli.exe executable
-        analysis_ply: Analysis depth in plies
-        position_id: Position identifier (XGID or GNUID format)
-
-    Returns:
-        Tuple of (gnubg_output_text, decision_type)
-    """
-    analyzer = GNUBGAnalyzer(gnubg_path, analysis_ply)
-    return analyzer.analyze_position(position_id)
@@ -22,7 +22,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from ankigammon.anki.card_generator import CardGenerator
-from ankigammon.anki.card_styles import CARD_CSS
+from ankigammon.anki.card_styles import get_card_style_tag
 from ankigammon.models import Decision, DecisionType
 from ankigammon.parsers.xg_binary_parser import XGBinaryParser
 
@@ -570,10 +570,9 @@ table.parsed-moves th, table.parsed-moves td {{
     padding: 4px 8px;
 }}
 table.parsed-moves th {{ background: #eef3f8; }}
-
-/* Inline the production card CSS so the back-card HTML renders correctly. */
-{CARD_CSS}
 </style>
+<!-- Production card CSS so the back-card HTML renders correctly. -->
+{get_card_style_tag()}
 </head>
 <body>
 <h1>Analysis-level badge sample report</h1>
@@ -0,0 +1,296 @@
+"""Tests for the AnkiConnect client.
+
+Exports queue notes and send them in batches (addNotes in "add" mode,
+a few multi requests per batch in "upsert" mode) instead of several
+requests per card, and invoke() hand-encodes its JSON
+payload over one kept-alive connection. These tests stub ``invoke`` or
+serve requests from a local fake, so no Anki instance is needed.
+"""
+
+import http.client
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+
+from ankigammon.anki.ankiconnect import AnkiConnect
+from ankigammon.anki.card_styles import get_card_css
+
+
+def _client():
+    client = AnkiConnect(deck_name="Test Deck")
+    client.invoke = mock.Mock()
+    return client
+
+
+def test_build_note_defaults_to_client_deck():
+    client = _client()
+    note = client.build_note("front", "back", ["tag"], xgid="XGID=abc")
+
+    assert note['deckName'] == "Test Deck"
+    assert note['fields'] == {
+        'XGID': "XGID=abc", 'Front': "front", 'Back': "back", 'AnalysisData': '',
+    }
+    assert note['tags'] == ["tag"]
+
+
+def test_add_notes_sends_single_request():
+    client = _client()
+    client.invoke.return_value = [1, 2, 3]
+    notes = [client.build_note(f"f{i}", f"b{i}", []) for i in range(3)]
+
+    assert client.add_notes(notes) == [1, 2, 3]
+    client.invoke.assert_called_once_with('addNotes', notes=notes)
+
+
+def test_add_notes_empty_is_noop():
+    client = _client()
+    assert client.add_notes([]) == []
+    client.invoke.assert_not_called()
+
+
+def test_add_note_wraps_add_notes():
+    client = _client()
+    client.invoke.return_value = [42]
+
+    assert client.add_note("front", "back", [], deck_name="Other") == 42
+    (action,), params = client.invoke.call_args
+    assert action == 'addNotes'
+    assert params['notes'][0]['deckName'] == "Other"
+
+
+def test_add_note_rejected_raises():
+    client = _client()
+    client.invoke.return_value = [None]
+
+    with pytest.raises(Exception, match="could not be added"):
+        client.add_note("front", "back", [])
+
+
+def test_invoke_posts_json_bytes_and_decodes_result():
+    client = AnkiConnect()
+    with mock.patch.object(client, '_post', return_value=b'{"result": 6, "error": null}') as post:
+        assert client.invoke('version') == 6
+
+    (body,), _ = post.call_args
+    assert isinstance(body, bytes)
+    assert json.loads(body) == {'action': 'version', 'version': 6, 'params': {}}
+
+
+def test_invoke_reports_invalid_json_as_request_failure():
+    client = AnkiConnect()
+    with mock.patch.object(client, '_post', return_value=b'<html>not anki</html>'):
+        with pytest.raises(Exception, match="Request failed"):
+            client.invoke('version')
+
+
+class _FakeAnkiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = set()
+
+    def do_POST(self):
+        _FakeAnkiHandler.connections.add(self.client_address)
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        body = json.dumps({'result': request['action'], 'error': None}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_anki():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeAnkiHandler)
+    _FakeAnkiHandler.connections = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_invoke_reuses_one_connection(fake_anki):
+    with AnkiConnect(url=fake_anki) as client:
+        assert client.invoke('version') == 'version'
+        assert client.invoke('deckNames') == 'deckNames'
+
+    assert len(_FakeAnkiHandler.connections) == 1
+
+
+def test_invoke_without_server_reports_connection_failure():
+    client = AnkiConnect(url="http://127.0.0.1:1")
+    with pytest.raises(Exception, match="Could not connect to Anki-Connect"):
+        client.invoke('version')
+
+
+def _client_with_connections(*connections):
+    client = AnkiConnect()
+    client._connection_class = mock.Mock(side_effect=list(connections))
+    return client
+
+
+def test_refused_connection_fails_without_retry():
+    conn = mock.Mock()
+    conn.request.side_effect = ConnectionRefusedError("refused")
+    client = _client_with_connections(conn)
+
+    with pytest.raises(Exception, match="Could not connect"):
+        client.invoke('version')
+    assert client._connection_class.call_count == 1
+
+
+def test_stale_keepalive_socket_reconnects_once():
+    ok = mock.Mock()
+    ok.getresponse.return_value = mock.Mock(status=200, read=lambda: b'{"result": 6}')
+    stale = mock.Mock()
+    stale.request.side_effect = http.client.RemoteDisconnected("closed")
+    down = mock.Mock()
+    down.request.side_effect = ConnectionRefusedError("refused")
+    client = _client_with_connections(ok, down)
+
+    assert client.invoke('version') == 6
+    client._conn = stale  # server closed the kept-alive socket in between
+
+    with pytest.raises(Exception, match="Could not connect"):
+        client.invoke('version')
+    # One fresh connection after the stale one, and no further attempts
+    assert client._connection_class.call_count == 2
+
+
+def test_request_is_not_resent_after_it_was_sent():
+    """Anki may already have run an action whose response was lost, so
+    re-sending it (e.g. addNotes) could add the notes twice."""
+    sent = mock.Mock()
+    sent.getresponse.side_effect = ConnectionResetError("reset")
+    client = _client_with_connections(mock.Mock())
+    client._conn = sent
+
+    with pytest.raises(Exception, match="Could not connect"):
+        client.invoke('addNotes', notes=[])
+    sent.request.assert_called_once()
+    assert client._connection_class.call_count == 0
+    assert client._conn is None
+
+
+def test_closed_keepalive_socket_is_replaced_before_sending(fake_anki):
+    import socket
+
+    with AnkiConnect(url=fake_anki) as client:
+        client.invoke('version')
+        # Simulate the server having closed the idle connection
+        client._conn.sock.close()
+        server_side, client._conn.sock = socket.socketpair()
+        server_side.close()
+
+        assert client.invoke('deckNames') == 'deckNames'
+
+    assert len(_FakeAnkiHandler.connections) == 2
+
+
+def test_add_notes_splits_into_batches():
+    client = AnkiConnect(batch_size=2)
+    client.invoke = mock.Mock(side_effect=lambda action, notes: [n['fields']['Front'] for n in notes])
+    notes = [client.build_note(f"f{i}", "b", []) for i in range(5)]
+
+    assert client.add_notes(notes) == ["f0", "f1", "f2", "f3", "f4"]
+    assert [len(c.kwargs['notes']) for c in client.invoke.call_args_list] == [2, 2, 1]
+
+
+def test_create_model_and_deck_only_hit_anki_once():
+    client = _client()
+    client.invoke.side_effect = lambda action, **params: {
+        'modelNames': ["AnkiGammon"],
+        'modelStyling': {'css': ".card{}"},
+        'modelFieldNames': ["XGID", "Front", "Back", "AnalysisData"],
+    }.get(action)
+
+    client.create_model()
+    calls_after_first = client.invoke.call_count
+    client.create_model()
+    client.create_deck("Deck A")
+    client.create_deck("Deck A")
+    client.create_deck("Deck B")
+
+    # modelNames, modelStyling, updateModelStyling, modelFieldNames
+    assert calls_after_first == 4
+    actions = [c.args[0] for c in client.invoke.call_args_list[calls_after_first:]]
+    assert actions == ['createDeck', 'createDeck']
+
+
+def test_create_model_skips_unchanged_styling():
+    client = _client()
+    client.invoke.side_effect = lambda action, **params: {
+        'modelNames': ["AnkiGammon"],
+        'modelStyling': {'css': get_card_css()},
+        'modelFieldNames': ["XGID", "Front", "Back", "AnalysisData"],
+    }.get(action)
+
+    client.create_model()
+
+    actions = [c.args[0] for c in client.invoke.call_args_list]
+    assert actions == ['modelNames', 'modelStyling', 'modelFieldNames']
+
+
+def _fake_upsert_anki(existing):
+    """invoke() stand-in for an Anki holding ``existing`` {xgid: note id}."""
+    def invoke(action, **params):
+        if action == 'multi':
+            replies = []
+            for sub in params['actions']:
+                if sub['action'] == 'findNotes':
+                    xgid = sub['params']['query'].split('"')[1][len('XGID:'):]
+                    replies.append({'result': [existing[xgid]] if xgid in existing else [], 'error': None})
+                else:
+                    replies.append({'result': None, 'error': None})
+            return replies
+        if action == 'notesInfo':
+            return [{'noteId': nid, 'tags': ["old"], 'cards': [nid * 10]} for nid in params['notes']]
+        if action == 'addNotes':
+            return [100 + i for i in range(len(params['notes']))]
+    return mock.Mock(side_effect=invoke)
+
+
+def test_upsert_notes_batches_lookups_updates_and_adds():
+    client = AnkiConnect(deck_name="Deck")
+    client.invoke = _fake_upsert_anki({"XGID=a": 7})
+    notes = [
+        client.build_note("a", "b", ["new"], xgid="XGID=a"),
+        client.build_note("b1", "b", [], xgid="XGID=b"),
+        client.build_note("none", "b", []),
+        client.build_note("b2", "b", [], xgid="XGID=b"),
+    ]
+
+    assert client.upsert_notes(notes) == [7, 100, 101, 100]
+
+    calls = client.invoke.call_args_list
+    assert [c.args[0] for c in calls] == ['multi', 'notesInfo', 'multi', 'addNotes']
+    assert [a['action'] for a in calls[0].kwargs['actions']] == ['findNotes', 'findNotes']
+    assert [(a['action'], a['params']) for a in calls[2].kwargs['actions']] == [
+        ('updateNoteFields', {'note': {'id': 7, 'fields': notes[0]['fields']}}),
+        ('removeTags', {'notes': [7], 'tags': "old"}),
+        ('addTags', {'notes': [7], 'tags': "new"}),
+        ('changeDeck', {'cards': [70], 'deck': "Deck"}),
+    ]
+    # The repeated XGID is added once, with the content of its last note
+    assert [n['fields']['Front'] for n in calls[3].kwargs['notes']] == ["b2", "none"]
+
+
+def test_upsert_note_wraps_upsert_notes():
+    client = AnkiConnect()
+    client.invoke = _fake_upsert_anki({})
+
+    assert client.upsert_note("front", "back", [], xgid="XGID=z") == 100
+
+
+def test_multi_raises_on_action_error():
+    client = _client()
+    client.invoke.return_value = [{'result': 1, 'error': None}, {'result': None, 'error': "boom"}]
+
+    with pytest.raises(Exception, match="error in addTags: boom"):
+        client.multi([('findNotes', {'query': "x"}), ('addTags', {'notes': [1], 'tags': "t"})])
@@ -0,0 +1,47 @@
+"""Tests for the card stylesheet shipped with every note model."""
+
+from ankigammon.anki.card_styles import (
+    _CARD_CSS_PATH,
+    _minify_css,
+    get_card_css,
+    get_card_style_tag,
+)
+
+
+class TestMinifyCss:
+    """The minifier must only drop bytes the CSS parser ignores."""
+
+    def test_comments_and_trailing_semicolons_removed(self):
+        css = "/* heading */\n.a {\n    color: red;\n    margin: 0 auto;\n}\n"
+        assert _minify_css(css) == ".a{color:red;margin:0 auto}"
+
+    def test_selector_combinators_keep_their_space(self):
+        assert _minify_css(".a .b :hover, .c > .d { x: 1 }") == ".a .b :hover,.c>.d{x:1}"
+
+    def test_quoted_strings_untouched(self):
+        css = '.a[style*="display: none"] { content: "▸ "; }\n/* "quoted" */'
+        assert _minify_css(css) == '.a[style*="display: none"]{content:"▸ "}'
+
+    def test_card_css_is_minified_source(self):
+        css = get_card_css()
+        source = _CARD_CSS_PATH.read_text(encoding="utf-8")
+        assert css == _minify_css(source)
+        assert "/*" not in css
+        assert ";}" not in css
+        assert "\n" not in css
+        assert css.count("{") == css.count("}") == source.count("{")
+
+    def test_one_media_block_per_landscape_breakpoint(self):
+        for max_height in ("600px", "450px"):
+            query = f"@media screen and (orientation:landscape) and (max-height:{max_height})"
+            assert get_card_css().count(query) == 1
+
+    def test_card_css_built_once_and_legacy_name_kept(self):
+        from ankigammon.anki import card_styles
+
+        assert get_card_css() is get_card_css()
+        assert card_styles.CARD_CSS is get_card_css()
+
+    def test_style_tag_wraps_card_css(self):
+        assert get_card_style_tag() == f"<style>{get_card_css()}</style>"
+        assert get_card_style_tag() is get_card_style_tag()
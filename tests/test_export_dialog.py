@@ -0,0 +1,51 @@
+"""Tests for the export dialog's status log."""
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+# The dialogs package imports QtWebEngine, which is an optional Qt add-on
+pytest.importorskip("PySide6.QtWebEngineWidgets")
+
+from ankigammon.gui.dialogs.export_dialog import ExportDialog
+from ankigammon.settings import Settings
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def dialog(qapp, tmp_path):
+    dlg = ExportDialog({"Deck": []}, Settings(config_path=tmp_path / "config.json"))
+    yield dlg
+    dlg.deleteLater()
+
+
+def _log_lines(dialog):
+    return dialog.log_text.toPlainText().splitlines()
+
+
+def test_status_messages_are_appended_in_one_batch(dialog):
+    dialog.on_status_message("first")
+    dialog.on_status_message("second")
+
+    assert dialog.status_label.text() == "second"
+    assert _log_lines(dialog) == []
+    assert dialog._log_timer.isActive()
+
+    dialog._log_timer.timeout.emit()
+
+    assert _log_lines(dialog) == ["first", "second"]
+    assert not dialog.log_text.isHidden()
+
+
+def test_finish_flushes_pending_lines_first(dialog):
+    dialog.on_status_message("Writing APKG file...")
+    dialog.on_finished(False, "disk full")
+
+    assert _log_lines(dialog) == ["Writing APKG file...", "", "FAILED: disk full"]
+    assert not dialog._log_timer.isActive()
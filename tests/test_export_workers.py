@@ -0,0 +1,259 @@
+"""Tests for the export dialog's background workers.
+
+The workers are QThreads, but ``run()`` is called directly here so the
+tests stay synchronous and need no event loop. The analyzer is a fake
+that records which positions it was asked to analyze, and card
+generation is patched to return canned HTML.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+# The dialogs package imports QtWebEngine, which is an optional Qt add-on
+pytest.importorskip("PySide6.QtWebEngineWidgets")
+
+from ankigammon.gui.dialogs import export_dialog
+from ankigammon.models import Decision, DecisionType, Player, Position
+
+
+XGID_A = "XGID=-a----E-C---eE---c-e----B-:0:0:1:55:1:0:0:5:10"
+XGID_B = "XGID=-b----E-C---eE---c-e----B-:0:0:1:31:0:0:0:5:10"
+
+
+class _FakeAnalyzer:
+    def __init__(self):
+        self.analyzed = []
+
+    def analyze_positions_parallel(self, position_ids, progress_callback=None,
+                                   cancellation_callback=None):
+        self.analyzed.append(list(position_ids))
+        return [(f"output for {pos_id}", DecisionType.CHECKER_PLAY) for pos_id in position_ids]
+
+    def parse_analysis(self, raw_output, xgid, decision_type):
+        decision = _decision(xgid=xgid, decision_type=decision_type, on_roll=Player.X)
+        decision.source_description = raw_output
+        return decision
+
+
+def _decision(**kwargs):
+    return Decision(position=Position(), **kwargs)
+
+
+def _settings():
+    return SimpleNamespace(analyzer_type="gnubg", gnubg_analysis_ply=2)
+
+
+def _run_analysis(decisions):
+    analyzer = _FakeAnalyzer()
+    worker = export_dialog.AnalysisWorker(decisions, _settings())
+    results = []
+    worker.finished.connect(lambda ok, msg, ds: results.append((ok, msg, ds)))
+    with mock.patch.object(export_dialog, "create_analyzer", return_value=analyzer):
+        worker.run()
+    return analyzer, results[0]
+
+
+def test_duplicate_positions_are_analyzed_once():
+    decisions = [
+        _decision(xgid=XGID_A, note="first"),
+        _decision(xgid=XGID_B),
+        _decision(xgid=XGID_A, note="second"),
+    ]
+
+    analyzer, (ok, _, analyzed) = _run_analysis(decisions)
+
+    assert ok
+    assert analyzer.analyzed == [[XGID_A, XGID_B]]
+    assert [d.xgid for d in analyzed] == [XGID_A, XGID_B, XGID_A]
+    assert [d.note for d in analyzed] == ["first", None, "second"]
+    assert analyzed[0] is not analyzed[2]
+
+
+def test_already_analyzed_positions_are_skipped():
+    done = _decision(xgid=XGID_A, candidate_moves=[mock.sentinel.move])
+
+    analyzer, (ok, _, analyzed) = _run_analysis([done, _decision(xgid=XGID_B)])
+
+    assert ok
+    assert analyzer.analyzed == [[XGID_B]]
+    assert analyzed[0] is done
+
+
+def _card(decision, card_id=None):
+    return {
+        'front': f"front {card_id}", 'back': "back", 'tags': [],
+        'xgid': decision.xgid, 'analysis_data': '',
+    }
+
+
+def _run_apkg_export(tmp_path, monkeypatch, generate_card):
+    from ankigammon.settings import Settings
+
+    monkeypatch.setattr(export_dialog.Path, "home", lambda: tmp_path)
+    grouped = {
+        "Deck A": [_decision(xgid=XGID_A)],
+        "Deck B": [_decision(xgid=XGID_B), _decision(xgid=XGID_A)],
+    }
+    worker = export_dialog.ExportWorker(
+        grouped, Settings(config_path=tmp_path / "config.json"), "apkg",
+        output_path=str(tmp_path / "out.apkg"),
+    )
+    progress, results = [], []
+    worker.progress.connect(progress.append)
+    worker.finished.connect(lambda ok, msg: results.append((ok, msg)))
+    with mock.patch("ankigammon.anki.card_generator.CardGenerator.generate_card",
+                    autospec=True, side_effect=generate_card) as gen:
+        worker.run()
+    return gen, progress, results[0]
+
+
+def test_apkg_export_numbers_cards_and_reports_progress(tmp_path, monkeypatch):
+    gen, progress, (ok, _) = _run_apkg_export(
+        tmp_path, monkeypatch, lambda self, decision, card_id=None: _card(decision, card_id),
+    )
+
+    assert ok
+    assert (tmp_path / "out.apkg").exists()
+    assert [c.kwargs['card_id'] for c in gen.call_args_list] == ["card_0", "card_1", "card_2"]
+    # One update per card boundary, then 1.0 again once the file is written
+    assert progress == [0.0, pytest.approx(1 / 3), pytest.approx(2 / 3), 1.0, 1.0]
+
+
+def test_apkg_export_stops_when_cancelled(tmp_path, monkeypatch):
+    def generate(self, decision, card_id=None):
+        if card_id == "card_1":
+            raise InterruptedError("cancelled")
+        return _card(decision, card_id)
+
+    gen, _, (ok, msg) = _run_apkg_export(tmp_path, monkeypatch, generate)
+
+    assert not ok
+    assert msg == "Export cancelled by user"
+    assert gen.call_count == 2
+    assert not (tmp_path / "out.apkg").exists()
+
+
+def test_engine_availability_probed_once_per_export(tmp_path, monkeypatch):
+    from ankigammon.settings import Settings
+
+    probe = mock.Mock(return_value=False)
+    monkeypatch.setattr(Settings, "is_gnubg_available", probe)
+
+    gen, _, (ok, _) = _run_apkg_export(
+        tmp_path, monkeypatch, lambda self, decision, card_id=None: _card(decision, card_id),
+    )
+
+    assert ok
+    assert gen.call_count == 3
+    assert probe.call_count == 1
+
+
+def test_sub_step_progress_is_throttled(monkeypatch):
+    worker = export_dialog.ExportWorker({}, _settings(), "apkg")
+    progress, status = [], []
+    worker.progress.connect(progress.append)
+    worker.status_message.connect(status.append)
+    monkeypatch.setattr(export_dialog.time, "monotonic", lambda: 100.0)
+
+    worker._report_progress(0.100, "step 1")
+    worker._report_progress(0.105, "step 2")  # too soon and too small
+    worker._report_progress(0.120, "step 2")  # moved the bar by 2%
+    worker._report_progress(0.121, "step 2", force=True)
+
+    assert progress == [0.100, 0.120, 0.121]
+    assert status == ["step 1", "step 2"]
+
+
+def test_card_progress_advances_within_the_cards_slice():
+    reports = []
+    progress = export_dialog._CardProgress(lambda *args: reports.append(args), total=4)
+
+    progress.start_card(2, substeps=2)
+    progress("cell 1")
+    progress("cell 2")
+    progress("extra")
+
+    assert reports == [
+        (0.625, "Position 3/4: cell 1"),
+        (pytest.approx(0.7375), "Position 3/4: cell 2"),
+        (pytest.approx(0.7375), "Position 3/4: extra"),
+    ]
+
+
+class _FakeAnkiConnect:
+    batch_size = 10
+
+    def __init__(self, deck_name=None, rejected=()):
+        self.sent = []
+        self.rejected = set(rejected)
+
+    def test_connection(self):
+        return True
+
+    def create_model(self):
+        pass
+
+    def create_deck(self, deck_name):
+        pass
+
+    def build_note(self, front, back, tags, deck_name, xgid, analysis_data):
+        return {'front': front, 'deckName': deck_name}
+
+    def add_notes(self, notes):
+        """Return note IDs like AnkiConnect, None for each rejected note."""
+        ids = []
+        for note in notes:
+            self.sent.append(note)
+            ids.append(None if len(self.sent) in self.rejected else len(self.sent))
+        return ids
+
+    upsert_notes = add_notes
+
+
+def _run_ankiconnect_export(tmp_path, client, generate_card, import_mode="add"):
+    from ankigammon.settings import Settings
+
+    grouped = {"Deck": [_decision(xgid=XGID_A), _decision(xgid=XGID_B), _decision(xgid=XGID_A)]}
+    worker = export_dialog.ExportWorker(
+        grouped, Settings(config_path=tmp_path / "config.json"), "ankiconnect",
+        import_mode=import_mode,
+    )
+    results = []
+    worker.finished.connect(lambda ok, msg: results.append((ok, msg)))
+    with mock.patch.object(export_dialog, "AnkiConnect", return_value=client), \
+            mock.patch("ankigammon.anki.card_generator.CardGenerator.generate_card",
+                       autospec=True, side_effect=generate_card):
+        worker.run()
+    return results[0]
+
+
+@pytest.mark.parametrize("import_mode", ["add", "upsert"])
+def test_ankiconnect_export_reports_rejected_cards(tmp_path, import_mode):
+    client = _FakeAnkiConnect(rejected={2})
+
+    ok, msg = _run_ankiconnect_export(
+        tmp_path, client, lambda self, decision, card_id=None: _card(decision, card_id),
+        import_mode=import_mode,
+    )
+
+    assert len(client.sent) == 3
+    assert not ok
+    assert msg == "Anki rejected 1 of 3 card(s) (card 2)"
+
+
+def test_ankiconnect_export_sends_cards_built_before_a_render_failure(tmp_path):
+    def generate(self, decision, card_id=None):
+        if len(rendered) == 2:
+            raise ValueError("bad position")
+        rendered.append(decision)
+        return _card(decision, card_id)
+
+    rendered = []
+    client = _FakeAnkiConnect()
+    ok, msg = _run_ankiconnect_export(tmp_path, client, generate)
+
+    assert [note['front'] for note in client.sent] == ["front None", "front None"]
+    assert not ok
+    assert msg.startswith("Export failed after adding 2/3 card(s) to Anki: Failed to render position 3/3")
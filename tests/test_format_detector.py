@@ -57,6 +57,17 @@ class TestMatchFileDetection:
         data2 = b"XGID=-a----E-C---eE---c-e----B-:0:0:1:00:0:0:3:0:10\nX to play 31"
         assert not FormatDetector.is_match_file(data2), "XG text should not be detected as match file"
 
+    def test_overlapping_match_indicators_all_count(self):
+        """Indicators sharing text (e.g. 'Wins ... point match') are each counted."""
+        assert FormatDetector.is_match_file(b"Alice wins a point match\nGame 1\n")
+        assert not FormatDetector.is_match_file(b"Alice wins a point\nGame 1\n")
+
+    def test_point_match_found_past_the_header(self):
+        """Only the header is decoded, but "N point match" is searched in the whole file."""
+        data = b"Imported from a long transcript\n" * 500 + b"7 point match\n"
+        assert len(data) > FormatDetector.HEADER_BYTES
+        assert FormatDetector.is_match_file(data)
+
 
 class TestBinaryFormatDetection:
     """Test binary format detection (XG, match files, etc)."""
@@ -74,3 +85,77 @@ class TestBinaryFormatDetection:
         assert result.format == InputFormat.MATCH_FILE, f"Expected MATCH_FILE, got {result.format}"
         assert result.count == 1
         assert "match file" in result.details.lower()
+
+
+class TestPositionSplitting:
+    """Test splitting pasted text into position blocks."""
+
+    def test_blocks_are_tagged_with_their_position_id_format(self):
+        detector = FormatDetector(get_settings())
+        text = (
+            "XGID=-a----E-C---eE---c-e----B-:0:0:1:55:1:0:0:5:10\n"
+            "X to play 55\n"
+            "11jjjjjhhhccccc:ooddddd88866666:N0N:65:W:IW:0:0:7:0\n"
+            "4HPwATDgc/ABMA:MIEFAAAAAAAA"
+        )
+
+        blocks = detector._split_positions(text)
+
+        assert [id_format for _, id_format in blocks] == ["xgid", "ogid", "gnuid"]
+        assert blocks[0][0].endswith("X to play 55")
+
+    def test_text_before_first_marker_has_no_format(self):
+        detector = FormatDetector(get_settings())
+
+        blocks = detector._split_positions("Notes\n4HPwATDgc/ABMA:MIEFAAAAAAAA")
+
+        assert blocks == [("Notes", None), ("4HPwATDgc/ABMA:MIEFAAAAAAAA", "gnuid")]
+
+
+class TestDetectionCache:
+    """Test that repeat detections of the same text are cached."""
+
+    def test_unchanged_text_is_classified_once(self, monkeypatch):
+        detector = FormatDetector(get_settings())
+        monkeypatch.setattr(detector.settings, "is_gnubg_available", lambda: True)
+        FormatDetector._detect_text_cached.cache_clear()
+        calls = []
+        split = FormatDetector._split_positions
+        monkeypatch.setattr(FormatDetector, "_split_positions",
+                            classmethod(lambda cls, text: calls.append(text) or split(text)))
+
+        text = "XGID=-a----E-C---eE---c-e----B-:0:0:1:55:1:0:0:5:10"
+        first = detector.detect(text)
+        first.position_previews.append("changed by caller")
+        second = detector.detect(text)
+
+        assert len(calls) == 1
+        assert second.format == InputFormat.POSITION_IDS
+        assert second.position_previews == ["XGID=-a----E-C---eE---c-e----B-:0:0:1:55:1:0:0:5:10..."]
+
+    def test_gnubg_availability_is_part_of_the_key(self, monkeypatch):
+        detector = FormatDetector(get_settings())
+        FormatDetector._detect_text_cached.cache_clear()
+        text = "XGID=-a----E-C---eE---c-e----B-:0:0:1:55:1:0:0:5:10"
+
+        monkeypatch.setattr(detector.settings, "is_gnubg_available", lambda: False)
+        assert detector.detect(text).warnings == ["GnuBG not configured - analysis required"]
+
+        monkeypatch.setattr(detector.settings, "is_gnubg_available", lambda: True)
+        assert detector.detect(text).warnings == []
+
+
+class TestPositionPreviews:
+    """Test the preview text attached to detection results."""
+
+    def test_previews_limited_to_first_positions(self, monkeypatch):
+        detector = FormatDetector(get_settings())
+        monkeypatch.setattr(detector.settings, "is_gnubg_available", lambda: True)
+        text = "\n".join(
+            f"XGID=-a----E-C---eE---c-e----B-:0:0:1:{d}{d}:1:0:0:5:10" for d in "123456" * 2
+        )
+
+        result = detector.detect(text)
+
+        assert result.count == 12
+        assert len(result.position_previews) == FormatDetector.MAX_PREVIEWS
@@ -0,0 +1,131 @@
+"""Tests for GNUBGAnalyzer's multi-position paths.
+
+The batch path scripts every position into one gnubg-cli session and
+splits the combined stdout on sentinel lines. A fake gnubg executable
+stands in for the real engine: it replays the command file, printing the
+sentinels and a canned hint block per position, so the splitting and
+fallback signalling can be checked without gnubg installed. The same
+fake serves the thread-pooled analyze_positions_parallel() path.
+"""
+
+import sys
+
+import pytest
+
+from ankigammon.models import DecisionType
+from ankigammon.utils.gnubg_analyzer import GNUBGAnalyzer
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == 'win32', reason="fake gnubg relies on a shebang script"
+)
+
+XGID_A = "XGID=-b----E-C---eE---c-e----B-:0:0:1::0:0:0:7:10"
+XGID_B = "XGID=-b----E-C---eE---c-e----B-:0:0:1::1:2:0:7:10"
+
+FAKE_GNUBG = """\
+#!{python}
+import sys
+script = open(sys.argv[sys.argv.index('-c') + 1]).read().splitlines()
+current = None
+for line in script:
+    if line.startswith('>print('):
+        {print_sentinel}
+    elif line.startswith('set xgid'):
+        current = line.split()[-1]
+    elif line == 'hint':
+        print('Cubeful equities:')
+        print('1. No double           +0.172')
+        print('Position ' + current)
+"""
+
+
+def _make_fake_gnubg(tmp_path, print_sentinel="print(line[len('>print(\"'):-2])"):
+    path = tmp_path / "gnubg-cli"
+    path.write_text(FAKE_GNUBG.format(python=sys.executable, print_sentinel=print_sentinel))
+    path.chmod(0o755)
+    return GNUBGAnalyzer(str(path), analysis_ply=0)
+
+
+def test_batch_splits_output_per_position(tmp_path):
+    analyzer = _make_fake_gnubg(tmp_path)
+    progress = []
+
+    results = analyzer.analyze_positions_batch(
+        [XGID_A, XGID_B, XGID_A],
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert [dt for _, dt in results] == [DecisionType.CUBE_ACTION] * 3
+    assert f"Position {XGID_A}" in results[0][0]
+    assert f"Position {XGID_B}" in results[1][0]
+    assert XGID_B not in results[0][0]
+    assert f"Position {XGID_A}" in results[2][0]
+    assert progress[-1] == (3, 3)
+
+
+def test_batch_without_sentinels_raises_runtime_error(tmp_path):
+    """A gnubg build without Python support prints no sentinels; the caller
+    relies on RuntimeError to fall back to per-position analysis."""
+    analyzer = _make_fake_gnubg(tmp_path, print_sentinel="pass")
+
+    with pytest.raises(RuntimeError):
+        analyzer.analyze_positions_batch([XGID_A, XGID_B])
+
+
+def test_batch_honours_cancellation(tmp_path):
+    analyzer = _make_fake_gnubg(tmp_path)
+
+    with pytest.raises(InterruptedError):
+        analyzer.analyze_positions_batch(
+            [XGID_A, XGID_B], cancellation_callback=lambda: True
+        )
+    assert analyzer._current_process is None
+
+
+def test_parallel_keeps_input_order(tmp_path):
+    analyzer = _make_fake_gnubg(tmp_path)
+    progress = []
+
+    results = analyzer.analyze_positions_parallel(
+        [XGID_A, XGID_B, XGID_A, XGID_B],
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert [f"Position {x}" in out for (out, _), x in zip(results, [XGID_A, XGID_B] * 2)] == [True] * 4
+    assert sorted(progress) == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+HANG = "print(line[len('>print(\"'):-2], flush=True); import time; time.sleep(60)"
+
+
+def test_batch_times_out_on_a_stalled_position(tmp_path, monkeypatch):
+    from ankigammon.utils import gnubg_analyzer
+
+    monkeypatch.setattr(gnubg_analyzer, "_POSITION_TIMEOUT", 0.5)
+    analyzer = _make_fake_gnubg(tmp_path, print_sentinel=HANG)
+
+    with pytest.raises(RuntimeError, match="timed out on position 1 of 2"):
+        analyzer.analyze_positions_batch([XGID_A, XGID_B])
+    assert analyzer._current_process is None
+
+
+def test_cancel_stops_a_stalled_batch(tmp_path):
+    import threading
+
+    analyzer = _make_fake_gnubg(tmp_path, print_sentinel=HANG)
+    cancelled = threading.Event()
+    threading.Timer(0.5, cancelled.set).start()
+
+    with pytest.raises(InterruptedError):
+        analyzer.analyze_positions_batch([XGID_A, XGID_B], cancellation_callback=cancelled.is_set)
+
+
+def test_batch_keeps_stderr_out_of_hint_blocks(tmp_path):
+    analyzer = _make_fake_gnubg(
+        tmp_path,
+        print_sentinel="print(line[len('>print(\"'):-2]); print('warning: no weights', file=sys.stderr)",
+    )
+
+    results = analyzer.analyze_positions_batch([XGID_A, XGID_B])
+
+    assert all("warning" not in output for output, _ in results)
@@ -0,0 +1,220 @@
+"""Tests for the Add Positions dialog's pending list and preview."""
+
+import json
+from unittest import mock
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+# The dialogs package imports QtWebEngine, which is an optional Qt add-on
+pytest.importorskip("PySide6.QtWebEngineWidgets")
+
+from ankigammon.gui.dialogs.input_dialog import InputDialog
+from ankigammon.settings import Settings
+
+
+XGID_A = "XGID=-a----E-C---eE---c-e----B-:0:0:1:55:1:0:0:5:10"
+XGID_B = "XGID=-b----E-C---eE---c-e----B-:0:0:1:31:0:0:0:5:10"
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def dialog(qapp, tmp_path):
+    dlg = InputDialog(Settings(config_path=tmp_path / "config.json"))
+    yield dlg
+    dlg.deleteLater()
+
+
+def test_preview_html_reused_for_revisited_position(dialog):
+    a = dialog._parse_position_id(XGID_A)
+    b = dialog._parse_position_id(XGID_B)
+
+    with mock.patch.object(dialog.renderer, "render_svg", return_value="<svg/>") as render:
+        dialog._get_preview_svg(a)
+        dialog._get_preview_svg(b)
+        assert dialog._get_preview_svg(a) == "<svg/>"
+
+    assert render.call_count == 2
+
+
+def test_preview_cache_evicts_least_recently_used(dialog, monkeypatch):
+    monkeypatch.setattr(InputDialog, "PREVIEW_CACHE_SIZE", 1)
+    a = dialog._parse_position_id(XGID_A)
+    b = dialog._parse_position_id(XGID_B)
+
+    with mock.patch.object(dialog.renderer, "render_svg", return_value="<svg/>") as render:
+        dialog._get_preview_svg(a)
+        dialog._get_preview_svg(b)
+        dialog._get_preview_svg(a)
+
+    assert render.call_count == 3
+    assert len(dialog._preview_cache) == 1
+
+
+def test_preview_swaps_board_markup_after_page_load(dialog):
+    decision = dialog._parse_position_id(XGID_A)
+    dialog._show_empty_preview()
+    assert dialog.preview is None
+
+    with mock.patch.object(dialog.renderer, "render_svg", return_value='<svg id="b"/>'):
+        dialog._show_preview(decision)
+    assert dialog.preview is not None
+
+    with mock.patch.object(dialog.preview, "page") as page:
+        dialog._on_preview_loaded(True)
+        dialog._show_empty_preview()
+
+    scripts = [c.args[0] for c in page.return_value.runJavaScript.call_args_list]
+    assert scripts == [
+        """document.getElementById('board').innerHTML = "<svg id=\\"b\\"/>";""",
+        f"document.getElementById('board').innerHTML = "
+        f"{json.dumps(InputDialog.EMPTY_PREVIEW_MARKUP)};",
+    ]
+
+
+def test_status_icons_created_once(dialog):
+    from ankigammon.gui.dialogs import input_dialog
+
+    decision = dialog._parse_position_id(XGID_A)
+    with mock.patch.object(input_dialog.PendingPositionItem, "_icon_pending", None), \
+            mock.patch.object(input_dialog.qta, "icon", wraps=input_dialog.qta.icon) as icon:
+        for _ in range(3):
+            input_dialog.PendingPositionItem(decision, needs_analysis=True)
+
+    icon.assert_called_once()
+
+
+def _add(dialog, *position_ids):
+    from types import SimpleNamespace
+    from ankigammon.gui.format_detector import InputFormat
+
+    widget = dialog.input_widget
+    with mock.patch.object(widget, "get_text", return_value="\n".join(position_ids)), \
+            mock.patch.object(widget, "get_last_result",
+                              return_value=SimpleNamespace(format=InputFormat.POSITION_IDS)), \
+            mock.patch.object(dialog.settings, "is_gnubg_available", return_value=True):
+        dialog._on_add_clicked()
+
+
+def test_added_batch_selects_first_new_position_once(dialog):
+    _add(dialog, XGID_A)
+    selected = []
+    dialog.pending_list.currentItemChanged.connect(lambda current, _: selected.append(current))
+
+    _add(dialog, XGID_B, XGID_A, XGID_B)
+
+    assert dialog.pending_list.count() == len(dialog.pending_decisions) == 4
+    assert [item.decision.xgid for item in selected] == [XGID_B]
+    assert dialog.pending_list.currentRow() == 1
+
+
+@pytest.mark.parametrize("position_id, original_format", [
+    (XGID_A, "XGID"),
+    (XGID_A[len("XGID="):], "XGID"),
+    ("4HPwATDgc/ABMA:MIEFAAAAAAAA", "GNUID"),
+    ("11jjjjjhhhccccc:ooddddd88866666:N0N:65:W:IW:0:0:7:0", "OGID"),
+])
+def test_parse_position_id_formats(dialog, position_id, original_format):
+    decision = dialog._parse_position_id(position_id)
+    assert decision.original_position_format == original_format
+
+
+@pytest.mark.parametrize("position_id", ["", "XGID=", "not a position", "a:b"])
+def test_parse_position_id_rejects_garbage(dialog, position_id):
+    assert dialog._parse_position_id(position_id) is None
+
+
+def test_parse_input_skips_blank_lines_and_crlf(dialog):
+    from ankigammon.gui.format_detector import InputFormat
+
+    text = f"  {XGID_A}  \r\n\r\n\t\n{XGID_B}\r\n"
+    decisions = dialog._parse_input(text, InputFormat.POSITION_IDS)
+
+    assert [d.xgid for d in decisions] == [XGID_A, XGID_B]
+
+
+def test_repeated_position_id_is_parsed_once(dialog):
+    from ankigammon.gui.dialogs import input_dialog
+
+    input_dialog._parse_position_id_cached.cache_clear()
+    with mock.patch.object(input_dialog, "parse_xgid", wraps=input_dialog.parse_xgid) as parse:
+        first = dialog._parse_position_id(XGID_A)
+        second = dialog._parse_position_id(XGID_A)
+
+    parse.assert_called_once()
+    assert first.position == second.position
+    assert first.position is not second.position
+    first.position.points[1] += 1
+    assert dialog._parse_position_id(XGID_A).position == second.position
+
+
+def test_rapid_selection_changes_render_one_preview(dialog):
+    _add(dialog, XGID_A, XGID_B, XGID_A)
+    dialog._preview_timer.timeout.emit()
+
+    with mock.patch.object(dialog, "_show_preview") as show:
+        for row in (1, 2, 0, 1):
+            dialog.pending_list.setCurrentRow(row)
+        assert dialog._preview_timer.isActive()
+        show.assert_not_called()
+
+        dialog._preview_timer.timeout.emit()
+
+    show.assert_called_once_with(dialog.pending_decisions[1])
+
+
+def test_refresh_status_keeps_cached_text(dialog):
+    from ankigammon.gui.dialogs.input_dialog import PendingPositionItem
+
+    decision = dialog._parse_position_id(XGID_A)
+    item = PendingPositionItem(decision, needs_analysis=True)
+    text = item.text()
+
+    decision.candidate_moves = [mock.sentinel.move]
+    decision.note = "Prime vs prime"
+    with mock.patch.object(decision, "get_metadata_text") as metadata:
+        item.refresh_status(needs_analysis=False)
+
+    metadata.assert_not_called()
+    assert item.text() == text
+    assert not item.needs_analysis
+    assert item.toolTip().endswith("1 moves analyzed\n\nNote: Prime vs prime")
+
+
+def test_deleting_selected_rows_keeps_decisions_in_sync(dialog):
+    from PySide6.QtCore import QItemSelectionModel
+    from PySide6.QtWidgets import QMessageBox
+    from ankigammon.gui.dialogs import input_dialog
+
+    _add(dialog, XGID_A, XGID_B, XGID_A, XGID_B)
+    kept = [dialog.pending_decisions[0], dialog.pending_decisions[2]]
+    dialog.pending_list.clearSelection()
+    for row in (3, 1):
+        dialog.pending_list.setCurrentRow(row, QItemSelectionModel.Select)
+
+    with mock.patch.object(input_dialog.silent_messagebox, "question",
+                           return_value=QMessageBox.StandardButton.Yes):
+        dialog.pending_list._delete_selected_items()
+
+    assert [id(d) for d in dialog.pending_decisions] == [id(d) for d in kept]
+    assert [id(dialog.pending_list.item(i).decision) for i in range(2)] == [id(d) for d in kept]
+
+
+def test_position_id_goes_to_one_parser():
+    from ankigammon.gui.dialogs import input_dialog
+
+    input_dialog._parse_position_id_cached.cache_clear()
+    ogid = "11jjjjjhhhccccc:ooddddd88866666:N0N:65:W:IW:0:0:7:0"
+    with mock.patch.object(input_dialog, "parse_xgid") as xgid, \
+            mock.patch.object(input_dialog, "parse_gnuid") as gnuid:
+        assert input_dialog._parse_position_id_cached(ogid)[2] == "OGID"
+
+    xgid.assert_not_called()
+    gnuid.assert_not_called()
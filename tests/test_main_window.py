@@ -0,0 +1,100 @@
+"""Tests for the main window's preview pane."""
+
+from unittest import mock
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+# The dialogs package imports QtWebEngine, which is an optional Qt add-on
+pytest.importorskip("PySide6.QtWebEngineWidgets")
+
+from ankigammon.gui import main_window
+from ankigammon.gui.main_window import MainWindow
+from ankigammon.settings import Settings
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def window(qapp, tmp_path):
+    settings = Settings(config_path=tmp_path / "config.json")
+    settings.check_for_updates = False
+    win = MainWindow(settings)
+    yield win
+    win.deleteLater()
+
+
+def test_welcome_page_is_built_once():
+    main_window._welcome_html.cache_clear()
+    with mock.patch.object(main_window, "get_resource_path",
+                           wraps=main_window.get_resource_path) as resource:
+        first = main_window._welcome_html()
+        assert main_window._welcome_html() is first
+
+    resource.assert_called_once()
+    assert "No Position Loaded" in first
+
+
+XGID = "XGID=-a----E-C---eE---c-e----B-:0:0:1:55:1:0:0:5:10"
+
+
+def _decision():
+    from ankigammon.models import Decision, Player, Position
+
+    return Decision(position=Position(), xgid=XGID, dice=(5, 5), on_roll=Player.X)
+
+
+def test_web_view_replaces_placeholder_on_first_page(window):
+    layout = window._preview_layout
+    index = layout.indexOf(window._preview_placeholder)
+    assert window.preview is None
+
+    window._show_welcome()
+
+    assert window._preview_placeholder is None
+    assert layout.indexOf(window.preview) == index
+    assert layout.stretch(index) == 2
+
+
+def test_welcome_page_is_not_reloaded_while_shown(window):
+    decision = _decision()
+    window._show_welcome()
+
+    with mock.patch.object(window.preview, "setHtml") as set_html:
+        window._show_welcome()
+        set_html.assert_not_called()
+
+        window.show_decision(decision)
+        window._show_welcome()
+        window._show_welcome()
+
+    assert set_html.call_count == 2
+    assert set_html.call_args.args[0] == main_window._welcome_html()
+
+
+def test_revisited_decision_is_rendered_once(window):
+    a, b = _decision(), _decision()
+
+    with mock.patch.object(window.renderer, "render_svg", return_value="<svg/>") as render:
+        for decision in (a, b, a, b):
+            window.show_decision(decision)
+
+    assert render.call_count == 2
+
+
+def test_settings_change_drops_cached_previews(window):
+    decision = _decision()
+    window.show_decision(decision)
+
+    window.on_settings_changed(window.settings)
+
+    with mock.patch.object(window.renderer, "render_svg", return_value="<svg/>") as render:
+        window.show_decision(decision)
+
+    render.assert_called_once()
@@ -9,15 +9,28 @@ Covers:
 - `format_matrix_as_html`'s caption rendering: surfaces a note when the
   user's live current score falls outside the (possibly capped) matrix —
   important UX safeguard against silently misleading a card reader.
+- `generate_score_matrix`: cell XGIDs reach the engine once each and the
+  results are mapped back onto the right [row][col] cells.
+- `CardGenerator`: a position exported on several cards only has its
+  matrix computed once.
 """
 
+from typing import List
+from unittest import mock
+
 import pytest
 
 from ankigammon.analysis.score_matrix import (
+    ScoreMatrix,
     ScoreMatrixCell,
     format_matrix_as_html,
+    generate_score_matrix,
     resolve_effective_match_length,
 )
+from ankigammon.anki.card_generator import CardGenerator
+from ankigammon.models import Decision, DecisionType, Position
+from ankigammon.parsers.gnubg_parser import GNUBGParser
+from ankigammon.utils.analyzer_base import BackgammonAnalyzer
 
 
 class TestResolveEffectiveMatchLength:
@@ -57,6 +70,22 @@ def _minimal_matrix():
     return [[cell]]
 
 
+class TestCellDisplayedErrors:
+    """Only the two alternatives shown in a cell count towards 'close decision'."""
+
+    @pytest.mark.parametrize("best_action,errors,shown", [
+        ("N/T", (0.001, 0.050, 0.300), "50/300"),
+        ("TG/P", (0.001, 0.050, 0.300), "50/300"),
+        ("D/T", (0.050, 0.001, 0.300), "50/300"),
+        ("D/P", (0.050, 0.300, 0.001), "50/300"),
+    ])
+    def test_hidden_error_is_ignored(self, best_action, errors, shown):
+        cell = ScoreMatrixCell(2, 2, best_action, *errors)
+        assert cell.format_errors() == shown
+        assert not cell.has_low_errors()
+        assert cell.has_low_errors(threshold=51)
+
+
 class TestFormatMatrixCaption:
     """The off-grid caption protects against silently misleading the card reader
     when the live score falls outside a capped matrix."""
@@ -73,3 +102,127 @@ class TestFormatMatrixCaption:
         # Caption sits after the closing </table> tag, inside the wrapping div
         # (rindex for the outer </div> — the inner <div class="action"> cells also close)
         assert html.index("</table>") < html.index("matrix-caption") < html.rindex("</div>")
+
+
+CUBE_XGID = "XGID=-b----E-C---eE---c-e----B-:0:0:1:00:0:0:0:7:10"
+
+GNUBG_CUBE_OUTPUT = """\
+Cubeful equities:
+1. No double           +0.172
+2. Double, take        -0.361  (-0.533)
+3. Double, pass        +1.000  (+0.828)
+
+Proper cube action: No double, take
+"""
+
+
+class _FakeAnalyzer(BackgammonAnalyzer):
+    """Records which XGIDs reach the engine and returns a canned N/T hint."""
+
+    def __init__(self):
+        self.analyzed: List[str] = []
+
+    def analyze_positions_batch(self, position_ids, progress_callback=None,
+                                cancellation_callback=None):
+        self.analyzed.extend(position_ids)
+        return [(GNUBG_CUBE_OUTPUT, DecisionType.CUBE_ACTION) for _ in position_ids]
+
+    def analyze_position(self, position_id):
+        return self.analyze_positions_batch([position_id])[0]
+
+    def analyze_positions_parallel(self, position_ids, max_workers=None,
+                                   progress_callback=None, cancellation_callback=None):
+        return self.analyze_positions_batch(position_ids)
+
+    def parse_cube_decision(self, raw_output, cube_value=1):
+        return GNUBGParser._parse_cube_decision(raw_output, cube_value)
+
+    def analyze_match_file(self, file_path, max_moves=8, progress_callback=None):
+        raise NotImplementedError
+
+    def parse_analysis(self, raw_output, xgid, decision_type):
+        raise NotImplementedError
+
+    def parse_checker_play(self, raw_output):
+        raise NotImplementedError
+
+    def terminate(self):
+        pass
+
+
+class TestGenerateScoreMatrix:
+    """End-to-end matrix assembly against a fake engine."""
+
+    def test_every_cell_analyzed_once_and_mapped_back(self):
+        analyzer = _FakeAnalyzer()
+        matrix = generate_score_matrix(CUBE_XGID, 4, analyzer)
+
+        # 2a..4a on both axes -> 3x3 cells, each with a distinct score
+        assert len(analyzer.analyzed) == 9
+        assert len(set(analyzer.analyzed)) == 9
+        assert [len(row) for row in matrix] == [3, 3, 3]
+        assert [(c.player_away, c.opponent_away) for c in matrix[1]] == [(3, 2), (3, 3), (3, 4)]
+
+        cell = matrix[0][0]
+        assert cell.best_action == "N/T"
+        assert cell.error_no_double == 0.0
+        assert cell.error_double == pytest.approx(0.533)
+        assert cell.error_pass == pytest.approx(0.828)
+        assert cell.format_errors() == "533/828"
+
+    def test_errors_are_magnitudes_when_alternative_equity_is_higher(self):
+        """D/P (+1.000) out-equities the correct No Double here; the error
+        must still be reported as a positive magnitude."""
+        analyzer = _FakeAnalyzer()
+        cell = generate_score_matrix(CUBE_XGID, 2, analyzer)[0][0]
+
+        assert cell.best_action == "N/T"
+        assert cell.error_pass > 0
+        assert not cell.has_low_errors()
+
+    def test_identical_outputs_parsed_once(self):
+        analyzer = _FakeAnalyzer()
+        with mock.patch.object(
+            analyzer, 'parse_cube_decision', wraps=analyzer.parse_cube_decision
+        ) as parse:
+            generate_score_matrix(CUBE_XGID, 4, analyzer)
+
+        # All nine cells share the canned output text
+        assert parse.call_count == 1
+
+    def test_flat_cells_are_row_major(self):
+        matrix = generate_score_matrix(CUBE_XGID, 4, _FakeAnalyzer())
+
+        assert isinstance(matrix, ScoreMatrix)
+        assert matrix.size == 3
+        assert len(matrix.cells) == 9
+        assert matrix.cell(2, 1) is matrix[2][1] is matrix.cells[7]
+        assert matrix[-1] == matrix[2]
+        with pytest.raises(IndexError):
+            matrix[3]
+        assert format_matrix_as_html(matrix) == format_matrix_as_html(
+            [list(row) for row in matrix]
+        )
+
+
+class TestCardGeneratorMatrixReuse:
+    """Cards for the same cube position share one matrix computation."""
+
+    def test_repeated_position_hits_engine_once(self, tmp_path):
+        analyzer = _FakeAnalyzer()
+        gen = CardGenerator(tmp_path, analyzer=analyzer)
+        gen.settings = mock.Mock(
+            analyzer_type="gnubg", gnubg_analysis_ply=2, score_matrix_max_size=0,
+        )
+        gen.settings.is_gnubg_available.return_value = True
+        decision = Decision(
+            position=Position(), xgid=CUBE_XGID, match_length=4,
+            decision_type=DecisionType.CUBE_ACTION,
+        )
+
+        first = gen._generate_score_matrix_html(decision)
+        second = gen._generate_score_matrix_html(decision)
+
+        assert "score-matrix" in first
+        assert second == first
+        assert len(analyzer.analyzed) == 9
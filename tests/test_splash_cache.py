@@ -0,0 +1,62 @@
+"""Tests for the cached splash image in the GUI entry point.
+
+The splash used to be painted on every launch; it is now rendered once
+into a PNG under the user's cache directory and reloaded from there
+until the icon changes.
+"""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from ankigammon.gui import app as gui_app
+
+ICON_PATH = Path(gui_app.__file__).parent / "resources" / "icon.png"
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def test_second_load_uses_cached_png(qapp, tmp_path):
+    first = gui_app.load_splash_pixmap(ICON_PATH, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("splash-*.png"))) == 1
+
+    with mock.patch.object(gui_app, "render_splash_pixmap") as render:
+        second = gui_app.load_splash_pixmap(ICON_PATH, cache_dir=tmp_path)
+
+    render.assert_not_called()
+    assert (second.width(), second.height()) == (first.width(), first.height())
+
+
+def test_icon_newer_than_cache_rerenders(qapp, tmp_path):
+    gui_app.load_splash_pixmap(ICON_PATH, cache_dir=tmp_path)
+    cached = next(tmp_path.glob("splash-*.png"))
+    stale = ICON_PATH.stat().st_mtime - 60
+    os.utime(cached, (stale, stale))
+
+    with mock.patch.object(
+        gui_app, "render_splash_pixmap", wraps=gui_app.render_splash_pixmap
+    ) as render:
+        gui_app.load_splash_pixmap(ICON_PATH, cache_dir=tmp_path)
+
+    render.assert_called_once()
+
+
+def test_drop_shadow_is_baked_into_pixmap(qapp):
+    pixmap = gui_app.render_splash_pixmap(ICON_PATH)
+    image = pixmap.toImage()
+
+    # Just below the card's bottom edge: shadow, not the transparent margin
+    assert image.pixelColor(220, 325).alpha() > 0
+    assert image.pixelColor(2, 2).alpha() == 0
+
+    with mock.patch.object(gui_app, "load_splash_pixmap", return_value=pixmap):
+        assert gui_app.create_splash_screen(ICON_PATH).graphicsEffect() is None